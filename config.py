@@ -1,5 +1,6 @@
 # Configuration constants for the Force Plate App
 from mcculw.enums import AnalogInputMode, ULRange # Add imports
+from scipy.signal import butter
 
 # DAQ Settings
 SAMPLE_RATE = 1000  # Hz per channel
@@ -9,6 +10,7 @@ BOARD_NUM = 0        # DAQ board number (e.g., for mcculw)
 # Use actual mcculw enums
 MCC_INPUT_MODE = AnalogInputMode.DIFFERENTIAL
 MCC_VOLTAGE_RANGE = ULRange.BIP10VOLTS
+INSTANT_READ_RATE = 10000 # Hz per channel for short averaging bursts (zeroing reads); 4 ch x 10 kHz stays under the 48 kS/s limit
 
 # Calibration
 # Range: 0-333.333 kg per channel -> 0 - (333.333 * 9.81) N per channel = 3270 N per channel
@@ -20,6 +22,8 @@ N_PER_VOLT = 330.31 # N/V per channel (calibrated 2025-07-07)
 GRAVITY = 9.81 # m/s^2
 FILTER_ORDER = 4
 FILTER_CUTOFF = 50 # Hz - Low-pass filter cutoff for force data (at Nyquist, will be clamped in processing)
+# Low-pass Butterworth designed once at import as second-order sections (numerically robust, shared by all modules)
+FILTER_SOS = butter(FILTER_ORDER, min(FILTER_CUTOFF, SAMPLE_RATE / 2.0 * 0.99), btype='low', output='sos', fs=SAMPLE_RATE)
 BODYWEIGHT_THRESHOLD_N = 20.0 # Consistent 20N threshold for flight detection
 FORCE_ONSET_THRESHOLD_FACTOR = 0.05 # Factor of peak force to determine movement onset (can be adjusted)
 MIN_FLIGHT_SAMPLES = 20 # Minimum number of samples for a valid flight phase (20ms at 1000Hz)
@@ -30,6 +34,7 @@ MAX_FLIGHT_TIME = 0.8 # Maximum reasonable flight time for typical jumps
 # Buffer Settings
 CONTINUOUS_BUFFER_SECONDS = 10  # Size of circular buffer for continuous acquisition (seconds)
 TIMING_JITTER_THRESHOLD_MS = 5.0  # Threshold for detecting timing jitter (milliseconds)
+STATUS_MIN_INTERVAL_S = 0.25  # Minimum spacing of informational status messages sent per chunk (seconds)
 
 # Plotting Settings
 PLOT_WINDOW_DURATION_S = 5 # Duration of plot window in seconds 
@@ -5,31 +5,38 @@ GUI freezing.
 
 This implementation uses the mcculw library to interface with real DAQ hardware.
 """
+import sys
 import time
+import ctypes
 import numpy as np
-from PyQt6.QtCore import QObject, QThread, pyqtSignal, pyqtSlot, QMutex, QMutexLocker
+from PyQt6.QtCore import QObject, QThread, pyqtSignal, pyqtSlot, QMutex, QWaitCondition
 
 # Import the actual library and specific components
 from mcculw import ul
-from mcculw.enums import ScanOptions, ULRange, AnalogInputMode, FunctionType
+from mcculw.enums import ScanOptions, ULRange, AnalogInputMode, FunctionType, Status
 from mcculw.ul import ULError
 from mcculw.device_info import DaqDeviceInfo
 
 import config # Import config to use constants
+from processing.status_throttle import StatusThrottle
 from ctypes import c_double
 
+# Windows process priority class, set once when DAQHandler is created and kept for the
+# whole process lifetime (GUI thread included), not only while acquiring
+HIGH_PRIORITY_CLASS = 0x00000080
+
 class DAQWorker(QObject):
     """
     Worker object to perform DAQ scanning in a separate thread.
-    Emits raw data chunks.
+    Writes raw data chunks into a ring buffer shared with DAQHandler.
     """
-    # Signal payload: numpy array shape [chunk_size, num_channels]
-    data_chunk_signal = pyqtSignal(np.ndarray)
+    # Announces that another chunk was written to the shared ring (see rows_written)
+    chunk_ready = pyqtSignal()
     status_signal = pyqtSignal(str)
     error_signal = pyqtSignal(str)
     finished = pyqtSignal()
 
-    def __init__(self, board_num, num_channels, sample_rate, chunk_size, input_mode, scan_range, parent=None):
+    def __init__(self, board_num, num_channels, sample_rate, chunk_size, input_mode, scan_range, ring, parent=None):
         super().__init__(parent)
         self.board_num = board_num
         self.num_channels = num_channels
@@ -37,15 +44,59 @@ class DAQWorker(QObject):
         self.chunk_size = chunk_size
         self.input_mode = input_mode
         self.range = scan_range
+        
+        # Single-producer/single-consumer ring shared with DAQHandler: [rows, num_channels].
+        # Its length is a whole number of chunks, so a chunk never straddles the wrap.
+        self._ring = ring
+        self._write_index = 0
+        # Running total of rows written this scan. The consumer compares it with its own
+        # rows read to detect being lapped; a plain int is atomic to read under the GIL.
+        self.rows_written = 0
+        
+        # Driver read buffer for one chunk and its NumPy view, shared by both scan modes.
+        # The view aliases the ctypes memory, so each read shows up in it without a copy.
+        self._ct_buf = (c_double * (chunk_size * num_channels))()
+        self._np_view = np.frombuffer(self._ct_buf, dtype=np.float64).reshape((chunk_size, num_channels))
 
+        # Plain attribute: a single read/write is atomic under the GIL, so the hot loop
+        # can poll it without taking a lock
         self._is_running = False
-        self._mutex = QMutex()
+        self._status_throttle = StatusThrottle()
+        # Lets stop() wake the continuous loop out of its inter-poll wait immediately
+        self._wake_mutex = QMutex()
+        self._wake_condition = QWaitCondition()
         
         # Continuous acquisition parameters
         self._use_continuous = True  # Flag to switch between modes
         self._buffer_size_seconds = config.CONTINUOUS_BUFFER_SECONDS  # Size of circular buffer from config
         self._last_index = 0  # Track last read position in circular buffer
 
+    def _wait(self, seconds):
+        """Waits up to `seconds`, returning early as soon as stop() is called."""
+        self._wake_mutex.lock()
+        try:
+            if self._is_running:
+                self._wake_condition.wait(self._wake_mutex, max(1, int(seconds * 1000)))
+        finally:
+            self._wake_mutex.unlock()
+
+    def _emit_throttled_status(self, message):
+        """
+        Emits a status message from inside the acquisition loop, dropping it if another
+        was sent within config.STATUS_MIN_INTERVAL_S. Errors are never throttled.
+        """
+        if self._status_throttle.ready():
+            self.status_signal.emit(message)
+
+    def _publish(self, chunk):
+        """Copy a chunk into the shared ring and announce it."""
+        end = self._write_index + self.chunk_size
+        self._ring[self._write_index:end] = chunk  # Narrows the driver's doubles to float32
+        self._write_index = end % self._ring.shape[0]
+        # Count the rows only once they are in the ring, so the consumer never reads ahead
+        self.rows_written += self.chunk_size
+        self.chunk_ready.emit()
+
     @pyqtSlot()
     def run(self):
         if self._use_continuous:
@@ -55,14 +106,15 @@ class DAQWorker(QObject):
     
     def _run_continuous(self):
         """Run continuous background acquisition to eliminate gaps."""
-        with QMutexLocker(self._mutex):
-            self._is_running = True
+        self._is_running = True
             
         self.status_signal.emit(f"DAQ Worker started with CONTINUOUS background scanning (Board {self.board_num})")
         
-        # Calculate buffer size for circular buffer (10 seconds of data)
-        total_buffer_samples = int(self._buffer_size_seconds * self.sample_rate) * self.num_channels
+        # Size the circular buffer to a whole number of chunks (~10 seconds of data) so that
+        # every chunk is one contiguous block and a read never straddles the wrap point
         chunk_total_points = self.chunk_size * self.num_channels
+        chunks_in_buffer = max(2, int(np.ceil(self._buffer_size_seconds * self.sample_rate / self.chunk_size)))
+        total_buffer_samples = chunks_in_buffer * chunk_total_points
         
         # Allocate memory for continuous scanning
         memhandle = None
@@ -85,56 +137,60 @@ class DAQWorker(QObject):
             )
             
             self.status_signal.emit("Continuous background scanning started successfully")
-            ct_buf = (c_double * chunk_total_points)()
+            ct_buf = self._ct_buf
             self._last_index = 0
+            points_read = 0  # Total points consumed since the scan started
+            
+            # Resolve the hot-path UL calls and their constant arguments once
+            get_status = ul.get_status
+            buf_to_array = ul.scaled_win_buf_to_array
+            board_num = self.board_num
+            ai_function = FunctionType.AIFUNCTION
             
             # Main data collection loop
             while True:
-                with QMutexLocker(self._mutex):
-                    if not self._is_running:
-                        break
+                if not self._is_running:
+                    break
                         
                 # Get current scan status
-                status, cur_count, cur_index = ul.get_status(self.board_num, FunctionType.AIFUNCTION)
+                status, cur_count, cur_index = get_status(board_num, ai_function)
                 
-                # Calculate how much new data is available
-                if cur_index >= self._last_index:
-                    new_samples = cur_index - self._last_index
-                else:
-                    # Handle circular buffer wrap-around
-                    new_samples = (total_buffer_samples - self._last_index) + cur_index
+                # cur_count is the running total of points acquired; unlike cur_index it
+                # never wraps and is not -1 before the first samples arrive
+                new_samples = cur_count - points_read
+                
+                if new_samples > total_buffer_samples:
+                    # The scan has lapped the reader, so unread data was overwritten.
+                    # Resynchronise on the newest chunk boundary and keep acquiring.
+                    lost_points = cur_count - (cur_count % chunk_total_points) - points_read
+                    points_read += lost_points
+                    self._last_index = points_read % total_buffer_samples
+                    self.error_signal.emit(
+                        f"DAQ buffer overrun: {lost_points // self.num_channels} samples per channel lost")
+                    continue
                     
                 # Process data if we have at least one chunk worth
                 if new_samples >= chunk_total_points:
-                    # Extract chunk from circular buffer
-                    if self._last_index + chunk_total_points <= total_buffer_samples:
-                        # Simple case: no wrap-around
-                        ul.scaled_win_buf_to_array(memhandle, ct_buf, self._last_index, chunk_total_points)
-                    else:
-                        # Handle wrap-around
-                        first_part = total_buffer_samples - self._last_index
-                        second_part = chunk_total_points - first_part
-                        temp_buf = (c_double * chunk_total_points)()
-                        
-                        # Copy first part from end of buffer
-                        ul.scaled_win_buf_to_array(memhandle, temp_buf, self._last_index, first_part)
-                        # Copy second part from beginning of buffer
-                        ul.scaled_win_buf_to_array(memhandle, temp_buf[first_part:], 0, second_part)
-                        ct_buf[:] = temp_buf[:]
-                        
-                    # Update last index (with wrap-around)
-                    self._last_index = (self._last_index + chunk_total_points) % total_buffer_samples
+                    # Chunks never wrap because the buffer holds a whole number of them
+                    buf_to_array(memhandle, ct_buf, self._last_index, chunk_total_points)
+                    points_read += chunk_total_points
+                    self._last_index = points_read % total_buffer_samples
+                    
+                    # Hand the chunk over through the shared ring; ct_buf is reused next read
+                    self._publish(self._np_view)
                     
-                    # Convert to numpy and emit
-                    data_flat = np.ctypeslib.as_array(ct_buf)
-                    data_chunk = data_flat.reshape((self.chunk_size, self.num_channels))
-                    self.data_chunk_signal.emit(data_chunk)
+                    # More than a chunk still waiting means the loop fell behind; it drains
+                    # back-to-back without waiting, so report that at a bounded rate
+                    backlog = new_samples - chunk_total_points
+                    if backlog >= chunk_total_points:
+                        self._emit_throttled_status(
+                            f"DAQ reader catching up: {backlog // self.num_channels} samples per channel pending")
                 else:
                     # No full chunk available yet, calculate optimal wait time
                     # Wait for approximately 1/4 of the time needed for a chunk
                     samples_needed = chunk_total_points - new_samples
                     wait_time = max(0.001, (samples_needed / (self.sample_rate * self.num_channels)) * 0.25)
-                    time.sleep(wait_time)  # Dynamic wait based on samples needed
+                    self._wait(wait_time)  # Dynamic wait based on samples needed
                     
         except ULError as e:
             self.error_signal.emit(f"DAQ continuous scan error: {e}")
@@ -157,18 +213,15 @@ class DAQWorker(QObject):
     
     def _run_blocking(self):
         """Original blocking finite scan implementation."""
-        with QMutexLocker(self._mutex):
-            self._is_running = True
+        self._is_running = True
 
         self.status_signal.emit(f"DAQ Worker thread started (Board {self.board_num}) with blocking scans.")
         total_points = self.chunk_size * self.num_channels
-        ct_buf = (c_double * total_points)()
 
         try:
             while True:
-                with QMutexLocker(self._mutex):
-                    if not self._is_running:
-                        break
+                if not self._is_running:
+                    break
 
                 # Allocate DAQ buffer for this chunk
                 memhandle = ul.scaled_win_buf_alloc(total_points)
@@ -189,7 +242,7 @@ class DAQWorker(QObject):
                         ScanOptions.SCALEDATA
                     )
                     # Copy data out into our ctypes array
-                    ul.scaled_win_buf_to_array(memhandle, ct_buf, 0, total_points)
+                    ul.scaled_win_buf_to_array(memhandle, self._ct_buf, 0, total_points)
                 except ULError as e:
                     self.error_signal.emit(f"DAQ blocking scan error: {e}")
                     break
@@ -197,10 +250,8 @@ class DAQWorker(QObject):
                     # Always free the driver buffer
                     ul.win_buf_free(memhandle)
 
-                # Convert to numpy and reshape
-                data_flat = np.ctypeslib.as_array(ct_buf)
-                data_chunk = data_flat.reshape((self.chunk_size, self.num_channels))
-                self.data_chunk_signal.emit(data_chunk)
+                # Hand the chunk over through the shared ring
+                self._publish(self._np_view)
         except Exception as e:
             self.error_signal.emit(f"Unexpected error in blocking scan: {e}")
         finally:
@@ -209,13 +260,16 @@ class DAQWorker(QObject):
 
     @pyqtSlot()
     def stop(self):
-        """Signals the worker thread to stop."""
-        with QMutexLocker(self._mutex):
-            if self._is_running:
-                self._is_running = False
-                self.status_signal.emit("Stop signal sent.")
-            else:
-                self.status_signal.emit("Stop signal sent, but worker wasn't running.")
+        """Signals the worker thread to stop and wakes it if it is waiting for data."""
+        self._wake_mutex.lock()
+        was_running = self._is_running
+        self._is_running = False
+        self._wake_condition.wakeAll()
+        self._wake_mutex.unlock()
+        if was_running:
+            self.status_signal.emit("Stop signal sent.")
+        else:
+            self.status_signal.emit("Stop signal sent, but worker wasn't running.")
 
 
 class DAQHandler(QObject):
@@ -224,7 +278,7 @@ class DAQHandler(QObject):
     Provides methods to start/stop scanning and get status.
     """
     # Signals proxied from the worker or generated directly
-    data_chunk_signal = pyqtSignal(object) # Emits numpy array chunks
+    data_chunk_signal = pyqtSignal(object) # Emits numpy array chunks (views into the shared ring)
     daq_status_signal = pyqtSignal(str) # Overall status
     daq_error_signal = pyqtSignal(str)
 
@@ -240,6 +294,13 @@ class DAQHandler(QObject):
         self._thread = None
         self._worker = None
 
+        # Ring buffer the worker writes chunks into (~CONTINUOUS_BUFFER_SECONDS, whole chunks).
+        # Only the worker's row count crosses threads; the consumer reads rows in place.
+        # float32 is ample for scaled volts (the 14-bit ADC resolves ~1.2 mV on +/-10 V) and halves the traffic.
+        ring_chunks = max(2, int(np.ceil(config.CONTINUOUS_BUFFER_SECONDS * self.sample_rate / self.chunk_size)))
+        self._ring = np.zeros((ring_chunks * self.chunk_size, self.num_channels), dtype=np.float32)
+        self._rows_read = 0  # Running total of ring rows consumed this scan
+
         # Attempt to set input mode on initialization
         try:
             # Set the input mode for the board (assuming it applies to all channels for this device)
@@ -251,6 +312,21 @@ class DAQHandler(QObject):
             # Consider if this should be a critical error preventing startup
 
         self._initialize_device() # Check for device on init
+        self._raise_process_priority()
+
+    def _raise_process_priority(self):
+        """
+        Raise the process priority class on Windows to reduce scheduling jitter in the DAQ loop.
+        Applies to every thread of the process, and is not restored when acquisition stops.
+        """
+        if sys.platform != 'win32':
+            return
+        # use_last_error makes ctypes save the thread's last error right after each call
+        kernel32 = ctypes.WinDLL('kernel32', use_last_error=True)
+        if kernel32.SetPriorityClass(kernel32.GetCurrentProcess(), HIGH_PRIORITY_CLASS):
+            self.daq_status_signal.emit("Process priority raised to HIGH_PRIORITY_CLASS")
+        else:
+            self.daq_error_signal.emit(f"Could not raise process priority (error {ctypes.get_last_error()})")
 
     def _initialize_device(self):
         """Check if the DAQ device can be found."""
@@ -286,8 +362,16 @@ class DAQHandler(QObject):
             # Ignore errors as no operation might be running
             pass
             
-        # Add small delay to allow hardware to reset
-        time.sleep(0.5)
+        # Give the hardware up to 0.5 s to return to idle, but start as soon as it does
+        deadline = time.monotonic() + 0.5
+        while time.monotonic() < deadline:
+            try:
+                status, _, _ = ul.get_status(self.board_num, FunctionType.AIFUNCTION)
+            except ULError:
+                break
+            if status == Status.IDLE:
+                break
+            QThread.msleep(5)
         
         self.daq_status_signal.emit("Preparing DAQ worker thread...")
         self._thread = QThread(self)
@@ -297,13 +381,15 @@ class DAQHandler(QObject):
             sample_rate=self.sample_rate,
             chunk_size=self.chunk_size,
             input_mode=self.input_mode,
-            scan_range=self.range
+            scan_range=self.range,
+            ring=self._ring
         )
+        self._rows_read = 0
         
         self._worker.moveToThread(self._thread)
 
         # Connect worker signals to DAQHandler signals/slots
-        self._worker.data_chunk_signal.connect(self.data_chunk_signal) # Pass data through
+        self._worker.chunk_ready.connect(self._on_chunk_ready)       # Read new chunks from the ring
         self._worker.status_signal.connect(self.daq_status_signal) # Pass status through
         self._worker.error_signal.connect(self.daq_error_signal)   # Pass errors through
         self._worker.finished.connect(self._on_worker_finished)    # Handle worker completion
@@ -322,15 +408,41 @@ class DAQHandler(QObject):
         """Signals the DAQ worker thread to stop."""
         if self._worker and self._thread and self._thread.isRunning():
             self.daq_status_signal.emit("Requesting DAQ worker stop...")
-            # Signal the worker's run loop to exit. This is thread-safe due to mutex in worker.
+            # Signal the worker's run loop to exit; this also wakes it from its poll wait,
+            # so it returns within one driver call (at most one chunk in blocking mode)
             self._worker.stop()
-            # Ensure the thread quits and waits for cleanup
+            # Wait for the worker to finish so the driver buffer is always freed
             self._thread.quit()
-            self._thread.wait(500)
+            self._thread.wait()
         elif not self._thread or not self._thread.isRunning():
             self.daq_status_signal.emit("Stop requested but DAQ thread not active/running.")
         # No explicit ul.stop_background here; worker handles it.
 
+    # This slot runs in the DAQHandler's thread (likely main thread)
+    @pyqtSlot()
+    def _on_chunk_ready(self):
+        """Emits the next unread chunk of the ring as a view for synchronous processing."""
+        worker = self._worker
+        if worker is None:
+            return
+        ring_rows = self._ring.shape[0]
+        unconsumed = worker.rows_written - self._rows_read
+        if unconsumed <= 0:
+            # Left over from a resync below; its chunk was already read or skipped
+            return
+        if unconsumed >= ring_rows:
+            # The worker has lapped the reader, so the oldest unread chunk has been (or is
+            # being) overwritten. Resynchronise on the newest chunk and keep going.
+            lost_rows = unconsumed - self.chunk_size
+            self._rows_read += lost_rows
+            self.daq_error_signal.emit(
+                f"DAQ ring overrun: processing fell behind, {lost_rows} samples per channel dropped")
+        start_index = self._rows_read % ring_rows
+        self._rows_read += self.chunk_size
+        # The view stays valid until the worker laps the ring (~CONTINUOUS_BUFFER_SECONDS),
+        # so receivers must copy anything they keep beyond the current call
+        self.data_chunk_signal.emit(self._ring[start_index:start_index + self.chunk_size])
+
     # This slot runs in the DAQHandler's thread (likely main thread)
     @pyqtSlot()
     def _on_worker_finished(self):
@@ -351,16 +463,37 @@ class DAQHandler(QObject):
         self._thread = None 
         self.daq_status_signal.emit("DAQ Thread references cleared.")
 
-    def get_instant_voltage(self) -> np.ndarray | None:
-        """Reads a single voltage sample from each channel for zeroing."""
-        voltages = np.zeros(self.num_channels, dtype=np.float64)
+    def get_instant_voltage(self, num_samples=32) -> np.ndarray | None:
+        """
+        Reads the current voltage on each channel for zeroing.
+        
+        Takes one short finite scan of `num_samples` per channel instead of one
+        v_in() round trip per channel, and returns the per-channel mean.
+        """
+        total_points = num_samples * self.num_channels
+        memhandle = None
         try:
             # --- Real MCCULW Logic --- 
             self.daq_status_signal.emit("Reading instant voltages...")
-            for i in range(self.num_channels):
-                # Use v_in to get scaled voltage directly
-                voltages[i] = ul.v_in(self.board_num, i, self.range)
-            self.daq_status_signal.emit(f"Read voltages: {np.round(voltages, 4)}")
+            memhandle = ul.scaled_win_buf_alloc(total_points)
+            if not memhandle:
+                self.daq_error_signal.emit("Failed to allocate buffer for instant voltage read")
+                return None
+            ul.a_in_scan(
+                self.board_num,
+                0,
+                self.num_channels - 1,
+                total_points,
+                config.INSTANT_READ_RATE,
+                self.range,
+                memhandle,
+                ScanOptions.SCALEDATA
+            )
+            ct_buf = (c_double * total_points)()
+            ul.scaled_win_buf_to_array(memhandle, ct_buf, 0, total_points)
+            samples = np.frombuffer(ct_buf, dtype=np.float64).reshape((num_samples, self.num_channels))
+            voltages = samples.mean(axis=0)
+            self.daq_status_signal.emit("Read voltages: " + " ".join(f"{v:.4f}" for v in voltages))
             return voltages
             # --- End Real MCCULW Logic ---
         except ULError as e:
@@ -369,6 +502,9 @@ class DAQHandler(QObject):
         except Exception as e:
             self.daq_error_signal.emit(f"Unexpected error reading instant voltage: {e}")
             return None
+        finally:
+            if memhandle:
+                ul.win_buf_free(memhandle)
 
     def __del__(self):
         """Ensure cleanup on object deletion."""
@@ -2,6 +2,7 @@
 Main application window for the Force Plate DAQ and Analysis Tool.
 Integrates DAQ handling, data processing, plotting, and user interface.
 """
+import atexit
 import sys
 import os
 
@@ -14,20 +15,81 @@ from PyQt6.QtWidgets import (
     QPushButton, QLabel, QStatusBar, QTextEdit, QFileDialog,
     QRadioButton, QButtonGroup, QFrame, QTabWidget
 )
-from PyQt6.QtCore import pyqtSlot, QTimer, Qt
+from PyQt6.QtCore import QObject, QThread, pyqtSignal, pyqtSlot, QTimer, Qt, QEvent
 import logging
+import logging.handlers
+import queue
+import re
 
 import config
 from hardware.daq_handler import DAQHandler
 from processing.data_processor import DataProcessor
+from processing.jump_analyzer import (
+    result_key, RESULT_FLIGHT_TIME, RESULT_HEIGHT_FLIGHT, RESULT_HEIGHT_IMPULSE,
+    RESULT_BODY_WEIGHT, RESULT_PEAK_PROPULSIVE, RESULT_PEAK_BRAKING,
+    RESULT_CONTRACTION_TIME, RESULT_NOTE
+)
 from ui.plot_handler import PlotHandler
 from ui.calibration_widget import CalibrationWidget
 
+# The log format uses none of the thread/process fields, so skip collecting them
+# for every record
+logging.logThreads = False
+logging.logProcesses = False
+logging.logMultiprocessing = False
+
+# Log records are only queued on the calling (usually GUI) thread; a listener thread
+# owns the file handler, so disk writes never block the event loop
+_log_queue = queue.Queue(-1)
+_log_file_handler = logging.FileHandler('force_plate_app.log')
+_log_file_handler.setFormatter(logging.Formatter('%(asctime)s %(levelname)s: %(message)s'))
+_log_listener = logging.handlers.QueueListener(_log_queue, _log_file_handler)
+_log_listener.start()
+# Write out queued records on every exit path (sys.exit, unhandled exceptions), not
+# only after the event loop returns; the listener thread is a daemon
+atexit.register(_log_listener.stop)
+# Debug records (per-jump results dumps, marker details) are only built and written
+# when the app is started with --debug (or FORCE_PLATE_DEBUG is set in the environment).
+# Checked here rather than after QApplication parses argv, since logging is set up at import.
+_debug_logging = '--debug' in sys.argv or bool(os.environ.get('FORCE_PLATE_DEBUG'))
 logging.basicConfig(
-    filename='force_plate_app.log',
-    level=logging.DEBUG,
-    format='%(asctime)s %(levelname)s: %(message)s'
+    level=logging.DEBUG if _debug_logging else logging.INFO,
+    handlers=[logging.handlers.QueueHandler(_log_queue)]
 )
+logger = logging.getLogger(__name__)
+
+# Result key suffixes (after the "Jump #N " prefix) of the metrics shown at the top
+# of the results text, mapped to the name they are displayed under
+_PROMINENT_RESULT_KEYS = {
+    RESULT_FLIGHT_TIME: 'flight_time',
+    RESULT_HEIGHT_FLIGHT: 'flight_height',
+    RESULT_HEIGHT_IMPULSE: 'impulse_height',
+    RESULT_BODY_WEIGHT: 'bodyweight',
+    RESULT_PEAK_PROPULSIVE: 'peak_propulsive',
+    RESULT_PEAK_BRAKING: 'peak_braking',
+    RESULT_CONTRACTION_TIME: 'contraction_time',
+    RESULT_NOTE: 'analysis_note',
+}
+
+ZERO_SAMPLES = 100 * 32  # Samples per channel averaged for the zero offset (~0.3 s at INSTANT_READ_RATE)
+SAVE_BLOCK_ROWS = 65536  # Rows formatted per np.savetxt call when saving data
+STATUS_FLUSH_INTERVAL_MS = 75  # Status bar refresh interval for coalesced messages
+
+# Jump number ('#N') from the "Jump #N " prefix shared by all keys of a results dict
+_JUMP_NUMBER_RE = re.compile(r'Jump (#\d+)')
+
+class _ZeroWorker(QObject):
+    """Reads the zero offset voltages on a separate thread so the GUI stays responsive."""
+    finished = pyqtSignal(object)  # Per-channel mean voltages, or None if the read failed
+
+    def __init__(self, daq_handler, num_samples):
+        super().__init__()
+        self._daq_handler = daq_handler
+        self._num_samples = num_samples
+
+    @pyqtSlot()
+    def run(self):
+        self.finished.emit(self._daq_handler.get_instant_voltage(self._num_samples))
 
 class MainWindow(QMainWindow):
     def __init__(self, parent=None):
@@ -35,6 +97,19 @@ class MainWindow(QMainWindow):
         self.setWindowTitle("Force Plate Analysis Tool")
         self.setGeometry(100, 100, 1000, 700) # x, y, width, height
 
+        # --- Status Bar --- (first, so errors during setup can be shown)
+        self._status_bar = QStatusBar() # Kept to skip the statusBar() lookup on every message
+        self.setStatusBar(self._status_bar)
+        self._status_bar.showMessage("Application Started. Ready.")
+        
+        # Status messages arrive many times per second during acquisition; the bar only
+        # shows the latest one per interval instead of repainting for each
+        self._pending_status = None
+        self._status_timer = QTimer(self)
+        self._status_timer.setSingleShot(True)
+        self._status_timer.setInterval(STATUS_FLUSH_INTERVAL_MS)
+        self._status_timer.timeout.connect(self._flush_status)
+
         # --- Configuration Check ---
         if config.NUM_CHANNELS <= 0:
             print("Error: config.NUM_CHANNELS must be greater than 0.")
@@ -44,7 +119,7 @@ class MainWindow(QMainWindow):
         if config.MIN_FLIGHT_SAMPLES <= 0:
             errors.append("MIN_FLIGHT_SAMPLES must be positive.")
         if errors:
-            logging.error("Configuration validation failed: " + "; ".join(errors))
+            logger.error("Configuration validation failed: %s", "; ".join(errors))
             self.show_error("Config validation error. See log.")
             sys.exit(1)
 
@@ -147,10 +222,6 @@ class MainWindow(QMainWindow):
         # Add the plot layout to main layout
         self.main_layout.addLayout(self.plot_layout, 3)  # Takes 3 parts of stretch
 
-        # --- Status Bar ---
-        self.setStatusBar(QStatusBar())
-        self.statusBar().showMessage("Application Started. Ready.")
-
         # --- Initialize Backend Components ---
         # Initialize DAQ and Processor first
         self.daq_handler = DAQHandler(
@@ -186,12 +257,16 @@ class MainWindow(QMainWindow):
         # --- Connect Signals and Slots ---
         self._connect_signals()
 
-        # --- Initial Button States ---
+        # --- Initial Button States --- (set only here; Start and Zero are enabled by default)
         self.btn_stop.setEnabled(False)
         self.btn_save.setEnabled(False)
 
         # Keep last displayed results so we can update braking later
         self._last_results = {}
+        self._braking_line = None # Rendered peak braking line, patched in place on braking updates
+        self._zero_thread = None # Thread running a zero offset read, if any
+        self._zero_worker = None
+        self._zero_button_states = (True, True) # Button states to restore after zeroing
         
 
     def _connect_signals(self):
@@ -214,8 +289,11 @@ class MainWindow(QMainWindow):
         # Data Processor Signals
         self.data_processor.status_signal.connect(self.update_status)
         # Connect processor's processed data output to the plot handler's input slot
-        # This connection should now work as both objects exist
+        # This connection should now work as both objects exist (dropped while the plot is hidden)
         self.data_processor.processed_data_signal.connect(self.plot_handler.update_plot)
+        self._plot_updates_connected = True
+        # The plot is hidden while another tab (e.g. Calibration) is showing
+        self.tab_widget.currentChanged.connect(self._update_plot_feed)
         # Connect processor's analysis results to the GUI update slot
         self.data_processor.analysis_complete_signal.connect(self.display_results)
         self.data_processor.peak_braking_signal.connect(self._update_peak_braking)
@@ -229,12 +307,6 @@ class MainWindow(QMainWindow):
         
         # Connect processed data to calibration widget for live readings
         self.data_processor.processed_data_signal.connect(self.update_calibration_readings)
-
-        # Update button states AFTER connections are made
-        self.btn_start.setEnabled(True)
-        self.btn_zero.setEnabled(True)
-        self.btn_stop.setEnabled(False)
-        self.btn_save.setEnabled(False)
         
     @pyqtSlot(str, int)
     def update_calibration_status(self, message, countdown):
@@ -259,22 +331,41 @@ class MainWindow(QMainWindow):
     @pyqtSlot()
     def zero_plate(self):
         """Acquires current voltage levels and sends them as zero offset."""
+        if self._zero_thread is not None:
+            return # Already zeroing
         self.update_status("Zeroing plate (averaging multiple samples)...")
         # Ensure any running acquisition is stopped so we can read instant voltages
         self.daq_handler.stop_scan()
-        QApplication.processEvents()
-        N_SAMPLES = 100
-        voltages_accum = np.zeros(config.NUM_CHANNELS, dtype=float)
-        for i in range(N_SAMPLES):
-            v = self.daq_handler.get_instant_voltage()
-            if v is None:
-                self.show_error(f"Failed to read sample {i+1}/{N_SAMPLES} during zeroing.")
-                return
-            voltages_accum += v
-            QApplication.processEvents()
-        avg_offset = voltages_accum / N_SAMPLES
+        
+        # Don't start acquiring or zero again until the offset read finishes
+        self._zero_button_states = (self.btn_start.isEnabled(), self.btn_zero.isEnabled())
+        self.btn_start.setEnabled(False)
+        self.btn_zero.setEnabled(False)
+        
+        # The read is one finite scan (~0.3 s); run it off the GUI thread
+        self._zero_thread = QThread(self)
+        self._zero_worker = _ZeroWorker(self.daq_handler, ZERO_SAMPLES)
+        self._zero_worker.moveToThread(self._zero_thread)
+        self._zero_thread.started.connect(self._zero_worker.run)
+        self._zero_worker.finished.connect(self._on_zero_finished)
+        self._zero_worker.finished.connect(self._zero_thread.quit)
+        self._zero_thread.finished.connect(self._zero_worker.deleteLater)
+        self._zero_thread.finished.connect(self._zero_thread.deleteLater)
+        self._zero_thread.start()
+
+    @pyqtSlot(object)
+    def _on_zero_finished(self, avg_offset):
+        """Applies the zero offset read by _ZeroWorker."""
+        self._zero_thread = None
+        self._zero_worker = None
+        start_enabled, zero_enabled = self._zero_button_states
+        self.btn_start.setEnabled(start_enabled)
+        self.btn_zero.setEnabled(zero_enabled)
+        if avg_offset is None:
+            self.show_error("Failed to read voltages during zeroing.")
+            return
         self.data_processor.set_zero_offset(avg_offset)
-        self.update_status(f"Zero offset acquired (averaged {N_SAMPLES} samples).")
+        self.update_status(f"Zero offset acquired (averaged {ZERO_SAMPLES} samples).")
         
         # Notify calibration widget if it exists
         if hasattr(self, 'calibration_widget'):
@@ -334,9 +425,8 @@ class MainWindow(QMainWindow):
 
     def _check_enable_analysis_save(self):
         """Checks if data exists to enable analysis/save buttons."""
-        # get_full_data now returns time, multi-channel force
-        time, force_multi = self.data_processor.get_full_data()
-        has_data = time is not None and len(time) > 0
+        # Only the sample count is needed here, not a snapshot of the data
+        has_data = self.data_processor.get_sample_count() > 0
         self.btn_save.setEnabled(has_data)
         if not has_data and not self.btn_start.isEnabled(): # If stopped but no data
              self.update_status("Acquisition stopped. No data collected.")
@@ -353,118 +443,93 @@ class MainWindow(QMainWindow):
     @pyqtSlot(dict)
     def display_results(self, results_dict):
         """Displays the analysis results in the text area, appending new results."""
-        # Store for later braking updates
-        self._last_results = results_dict.copy()
+        # Store for later braking updates (the processor does not keep or reuse the dict)
+        self._last_results = results_dict
+        self._braking_line = None
         if not results_dict:
             # Append a message if the dictionary is empty (e.g., analysis failed early)
             self.results_display.append("--- Analysis Attempt Failed ---")
             return
 
-        # Try to find a jump number in the keys to format the header
-        jump_num_str = ""
-        for key in results_dict.keys():
-            if key.startswith("Jump #"):
-                try:
-                    jump_num_str = key.split(" ")[1] # Extract '#N'
-                    break
-                except IndexError:
-                    pass # Malformed key, ignore
+        # Take the jump number for the header from the first key (all keys share it)
+        match = _JUMP_NUMBER_RE.match(next(iter(results_dict)))
+        jump_num_str = match.group(1) if match else ""
 
         if jump_num_str:
-            results_text = f"--- JUMP {jump_num_str} RESULTS ---\n"
+            results_parts = [f"--- JUMP {jump_num_str} RESULTS ---\n"]
         else:
-             results_text = "--- JUMP RESULTS ---\n" # Fallback header
+             results_parts = ["--- JUMP RESULTS ---\n"] # Fallback header
         
         # Log all keys and values in results_dict for debugging
-        print(f"DEBUG - Results dictionary keys: {list(results_dict.keys())}")
-        print(f"DEBUG - Results values: {results_dict}")
-        
-        # Extract important metrics first to display prominently
-        flight_time = None
-        flight_height = None
-        impulse_height = None
-        bodyweight = None
-        peak_propulsive = None
-        peak_braking = None
-        contraction_time = None
-        
-        # Direct key access for cleaner code
+        logger.debug("Results dictionary keys: %s", results_dict.keys())
+        logger.debug("Results values: %s", results_dict)
+        
+        # Sort the keys in one pass: important metrics to display prominently (looked
+        # up by key suffix) and everything else for the listing at the end
+        prominent = {}
+        other_results = []
         for key, value in results_dict.items():
-            if key.endswith("Flight Time (s)"):
-                flight_time = value
-            elif key.endswith("Jump Height (Flight Time) (m)"):
-                flight_height = value
-            elif key.endswith("Jump Height (Impulse) (m)"):
-                impulse_height = value
-            elif key.endswith("Body Weight (N)"):
-                bodyweight = value
-            elif key.endswith("Peak Propulsive Force (N)"):
-                peak_propulsive = value
-            elif key.endswith("Peak Braking Force (N)"):
-                peak_braking = value
-            elif key.endswith("Contraction Time (ms)"):
-                contraction_time = value
+            suffix = key.split(" ", 2)[-1] if key.startswith("Jump #") else key
+            name = _PROMINENT_RESULT_KEYS.get(suffix)
+            if name is not None:
+                prominent[name] = value
+            else:
+                other_results.append((key, value))
+                
+        flight_time = prominent.get('flight_time')
+        flight_height = prominent.get('flight_height')
+        impulse_height = prominent.get('impulse_height')
+        bodyweight = prominent.get('bodyweight')
+        peak_propulsive = prominent.get('peak_propulsive')
+        peak_braking = prominent.get('peak_braking')
+        contraction_time = prominent.get('contraction_time')
         
         # Display metrics in a clear, consistent format
         if flight_time is not None:
-            results_text += f"FLIGHT TIME: {flight_time} s\n"
+            results_parts.append(f"FLIGHT TIME: {flight_time} s\n")
             
         if contraction_time is not None:
-            results_text += f"CONTRACTION TIME: {contraction_time} ms\n"
+            results_parts.append(f"CONTRACTION TIME: {contraction_time} ms\n")
             
         if bodyweight is not None:
             # Convert bodyweight to kg and lbs for display
             bodyweight_kg = float(bodyweight) / config.GRAVITY
             bodyweight_lbs = bodyweight_kg * 2.20462
-            results_text += f"BODY WEIGHT: {float(bodyweight):.1f} N ({bodyweight_kg:.1f} kg / {bodyweight_lbs:.1f} lbs)\n"
+            results_parts.append(f"BODY WEIGHT: {float(bodyweight):.1f} N ({bodyweight_kg:.1f} kg / {bodyweight_lbs:.1f} lbs)\n")
             
         if peak_propulsive is not None:
-            results_text += f"PEAK PROPULSIVE FORCE: {peak_propulsive} N\n"
+            results_parts.append(f"PEAK PROPULSIVE FORCE: {peak_propulsive} N\n")
         if peak_braking is not None:
-            results_text += f"PEAK BRAKING FORCE: {peak_braking} N\n"
+            self._braking_line = f"PEAK BRAKING FORCE: {peak_braking} N"
+            results_parts.append(self._braking_line + "\n")
         
         if flight_height is not None:
             # Convert jump height from meters to inches and centimeters
             flight_height_in = flight_height * 39.3701
             flight_height_cm = flight_height * 100
-            results_text += f"JUMP HEIGHT (Flight Time): {flight_height_in:.2f} in ({flight_height_cm:.2f} cm)\n"
+            results_parts.append(f"JUMP HEIGHT (Flight Time): {flight_height_in:.2f} in ({flight_height_cm:.2f} cm)\n")
             self.update_status(f"Jump Height: {flight_height_in:.2f} in ({flight_height_cm:.2f} cm) (Flight Time)")
             
         if impulse_height is not None:
             # Convert impulse-based jump height from meters to inches and centimeters
             impulse_height_in = impulse_height * 39.3701
             impulse_height_cm = impulse_height * 100
-            results_text += f"JUMP HEIGHT (Impulse): {impulse_height_in:.2f} in ({impulse_height_cm:.2f} cm)\n"
+            results_parts.append(f"JUMP HEIGHT (Impulse): {impulse_height_in:.2f} in ({impulse_height_cm:.2f} cm)\n")
             self.update_status(f"Impulse-based Jump Height: {impulse_height_in:.2f} in ({impulse_height_cm:.2f} cm)")
             
         # Add a blank line after key metrics
         if flight_time or contraction_time or flight_height or impulse_height or peak_propulsive or peak_braking or bodyweight:
-            results_text += "\n"
+            results_parts.append("\n")
         else:
-            results_text += "No jump data detected. Check threshold settings.\n\n"
+            results_parts.append("No jump data detected. Check threshold settings.\n\n")
             
         # Check for any error messages or notes
-        analysis_note = None
-        for key, value in results_dict.items():
-            if "Analysis Note" in key:
-                analysis_note = value
-                break
-                
+        analysis_note = prominent.get('analysis_note')
         if analysis_note:
-            results_text += f"Analysis Note: {analysis_note}\n\n"
+            results_parts.append(f"Analysis Note: {analysis_note}\n\n")
 
         # Display the rest of the results that weren't already displayed
-        for key, value in results_dict.items():
-            # Skip the key metrics we already displayed
-            if ("Flight Time" in key or 
-                "Jump Height" in key or 
-                "Body Weight" in key or
-                "Peak Propulsive Force" in key or
-                "Peak Braking Force" in key or
-                "Contraction Time" in key or
-                "Analysis Note" in key):
-                continue
-
+        for key, value in other_results:
             # Remove the jump number prefix for cleaner display
             display_key = key
             if jump_num_str and key.startswith(f"Jump {jump_num_str}"):
@@ -472,14 +537,12 @@ class MainWindow(QMainWindow):
 
             # Format floats nicely
             if isinstance(value, float):
-                results_text += f"{display_key}: {value:.3f}\n"
+                results_parts.append(f"{display_key}: {value:.3f}\n")
             else:
-                results_text += f"{display_key}: {value}\n"
+                results_parts.append(f"{display_key}: {value}\n")
 
-        self.results_display.clear() # Clear previous results
-        self.results_display.setText(results_text) # Set new results
-        # Save the updated results
-        self._last_results = results_dict.copy()
+        # Replace previous results in one document update (plain text skips rich-text detection)
+        self.results_display.setPlainText("".join(results_parts))
         self.update_status("Analysis results updated.")
 
     def save_data(self):
@@ -501,17 +564,21 @@ class MainWindow(QMainWindow):
         if filePath:
             try:
                 self.update_status(f"Saving data to {filePath}...")
-                # Combine time and force into a 2D array
-                # Reshape time_data to (N, 1) to stack horizontally
-                time_col = time_data.reshape(-1, 1)
-                # Stack time column with force columns
-                save_data = np.hstack((time_col, force_data_multi))
-
                 # Create header
                 channel_headers = ",".join([f'Fz_Ch{i} (N)' for i in range(num_channels)])
                 header = f"Time (s),{channel_headers}\nSample Rate (Hz): {config.SAMPLE_RATE}, Filter Cutoff (Hz): {config.FILTER_CUTOFF}"
 
-                np.savetxt(filePath, save_data, delimiter=',', header=header, comments='')
+                # Write in blocks of rows (time column + force columns) so the whole
+                # recording is never stacked into one extra array; every block is
+                # assembled in the same preallocated buffer
+                block = np.empty((min(SAVE_BLOCK_ROWS, len(time_data)), num_channels + 1))
+                with open(filePath, 'w', buffering=1 << 20) as f:
+                    f.write(header + '\n')
+                    for start in range(0, len(time_data), SAVE_BLOCK_ROWS):
+                        rows = min(SAVE_BLOCK_ROWS, len(time_data) - start)
+                        block[:rows, 0] = time_data[start:start + rows]
+                        block[:rows, 1:] = force_data_multi[start:start + rows]
+                        np.savetxt(f, block[:rows], delimiter=',')
                 self.update_status(f"Data saved successfully to {filePath}.")
             except Exception as e:
                 self.show_error(f"Error saving file: {e}")
@@ -537,16 +604,25 @@ class MainWindow(QMainWindow):
     @pyqtSlot(str)
     def update_status(self, message):
         """Updates the status bar message and logs it."""
-        logging.info(message)
-        self.statusBar().showMessage(message)
-        print(f"Status: {message}") # Also print to console for debugging
+        logger.info(message)
+        self._pending_status = message
+        if not self._status_timer.isActive():
+            self._status_timer.start()
+
+    def _flush_status(self):
+        """Shows the latest message queued by update_status."""
+        if self._pending_status is not None:
+            self._status_bar.showMessage(self._pending_status)
+            self._pending_status = None
 
     @pyqtSlot(str)
     def show_error(self, message):
         """Shows an error message in the status bar and logs it."""
-        logging.error(message)
-        self.statusBar().showMessage(f"Error: {message}", 5000) # Show for 5 seconds
-        print(f"Error: {message}") # Also print to console
+        logger.error(message)
+        # Errors are shown immediately; a status queued before the error is dropped
+        self._pending_status = None
+        self._status_timer.stop()
+        self._status_bar.showMessage(f"Error: {message}", 5000) # Show for 5 seconds
     
 
     @pyqtSlot(np.ndarray, np.ndarray)
@@ -575,7 +651,7 @@ class MainWindow(QMainWindow):
         self.update_status(f"Calibration applied: New N/V ratio = {new_n_per_volt:.1f}")
         
         # Log calibration data
-        logging.info(f"Calibration applied: {calibration_data}")
+        logger.info("Calibration applied: %s", calibration_data)
     
     def closeEvent(self, event):
         """Ensures the DAQ thread is stopped cleanly on exit."""
@@ -585,14 +661,49 @@ class MainWindow(QMainWindow):
         if hasattr(self.daq_handler, '_thread') and self.daq_handler._thread:
             self.daq_handler._thread.quit()
             self.daq_handler._thread.wait(500)
+        # Let a zero offset read in progress finish (one short scan)
+        if self._zero_thread is not None:
+            self._zero_thread.quit()
+            self._zero_thread.wait()
         event.accept()
 
+    def changeEvent(self, event):
+        """Updates the plot feed when the window is minimized or restored."""
+        if event.type() == QEvent.Type.WindowStateChange and hasattr(self, '_plot_updates_connected'):
+            self._update_plot_feed()
+        super().changeEvent(event)
+
+    @pyqtSlot()
+    def _update_plot_feed(self):
+        """Feeds the plot only while it can be seen: window not minimized, Main tab showing."""
+        self._set_plot_updates_enabled(
+            not self.isMinimized() and self.tab_widget.currentWidget() is self.main_tab
+        )
+
+    def _set_plot_updates_enabled(self, enabled):
+        """Connects or disconnects processed data from the plot handler."""
+        if enabled == self._plot_updates_connected:
+            return
+        if enabled:
+            self.data_processor.processed_data_signal.connect(self.plot_handler.update_plot)
+        else:
+            self.data_processor.processed_data_signal.disconnect(self.plot_handler.update_plot)
+        self._plot_updates_connected = enabled
+
     @pyqtSlot(int, float)
     def _update_peak_braking(self, jump_number, braking_force):
         """Update only the peak braking force in the last results and re-render."""
-        key = f'Jump #{jump_number} Peak Braking Force (N)'
+        key = result_key(jump_number, RESULT_PEAK_BRAKING)
         if key in self._last_results:
             self._last_results[key] = braking_force
+            # Only the braking line changes, so overwrite it in the document rather
+            # than re-rendering all results
+            if self._braking_line is not None:
+                cursor = self.results_display.document().find(self._braking_line)
+                if not cursor.isNull():
+                    self._braking_line = f"PEAK BRAKING FORCE: {braking_force} N"
+                    cursor.insertText(self._braking_line)
+                    return
             # Re-display using updated dict
             self.display_results(self._last_results)
         else:
@@ -7,4 +7,5 @@ This package contains the core data processing pipeline:
 - calibration_manager.py: Bodyweight calibration state machine
 - jump_detector.py: Real-time jump detection
 - jump_analyzer.py: Post-jump analysis and metrics calculation
+- status_throttle.py: Rate limit for per-chunk status messages
 """
\ No newline at end of file
@@ -1,16 +1,16 @@
 """
 Manages memory-bounded data buffers for force plate data acquisition.
-Provides circular buffers to prevent unbounded memory growth during long sessions.
+Provides preallocated NumPy buffers to prevent unbounded memory growth during long sessions.
 """
 import numpy as np
-from collections import deque
 import config
 
 
 class BufferManager:
     """
     Manages time and force data buffers with bounded memory usage.
-    Uses circular buffers (deque) to prevent memory leaks during extended acquisitions.
+    Keeps the most recent max_duration_seconds of samples in preallocated NumPy
+    arrays, so appends never allocate and reads are plain slices.
     """
     
     def __init__(self, sample_rate, num_channels, max_duration_seconds=300):
@@ -29,46 +29,70 @@ class BufferManager:
         # Calculate maximum number of samples to store
         self.max_samples = int(sample_rate * max_duration_seconds)
         
-        # Initialize circular buffers using deque
-        # These will automatically discard oldest data when full
-        self._time_buffer = deque(maxlen=self.max_samples)
-        self._force_buffers = [deque(maxlen=self.max_samples) for _ in range(num_channels)]
-        
-        # For efficient chunk appending, we'll temporarily store chunks
-        self._time_chunks = []
-        self._force_chunks = []
+        # Storage is twice the retained window. Samples are written at a cursor and, when
+        # the end of storage is reached, the retained window is moved back to the front in
+        # one copy. Each move buys max_samples of appends (amortized O(1) per sample) and the
+        # retained window is always one contiguous slice [_start:_end].
+        self._capacity = 2 * self.max_samples
+        self._time_store = np.empty(self._capacity, dtype=np.float64)
+        # Forces are stored as float32: ~0.1 mN resolution at plate loads is far below
+        # the ADC step, and every pass over the buffer moves half the bytes. Timestamps
+        # stay float64 since they are absolute epoch seconds.
+        self._force_store = np.empty((self._capacity, num_channels), dtype=np.float32)
+        # Summed Fz, stored once on append so no reader has to reduce the channels again
+        self._fz_store = np.empty(self._capacity, dtype=np.float32)
+        # Causally (forward-only) filtered Fz, aligned row for row with the samples
+        self._fz_filtered_store = np.zeros(self._capacity, dtype=np.float32)
+        self._start = 0  # First retained row
+        self._end = 0    # One past the last written row
+        self._total_samples = 0  # Samples appended since reset, including discarded ones
         
     def reset(self):
         """Clear all buffers and reset to initial state."""
-        self._time_buffer.clear()
-        for buffer in self._force_buffers:
-            buffer.clear()
-        self._time_chunks.clear()
-        self._force_chunks.clear()
-        
-    def append_chunk(self, time_chunk, force_chunk_multi_channel):
+        self._start = 0
+        self._end = 0
+        self._total_samples = 0
+        
+    def _compact(self):
+        """Move the retained window to the front of storage to make room for appends."""
+        retained = self._end - self._start
+        self._time_store[:retained] = self._time_store[self._start:self._end]
+        self._force_store[:retained] = self._force_store[self._start:self._end]
+        self._fz_store[:retained] = self._fz_store[self._start:self._end]
+        self._fz_filtered_store[:retained] = self._fz_filtered_store[self._start:self._end]
+        self._start = 0
+        self._end = retained
+        
+    def append_chunk(self, time_chunk, force_chunk_multi_channel, fz_filtered_chunk=None, fz_chunk=None):
         """
         Append a new chunk of data to the buffers.
         
         Args:
             time_chunk: 1D array of timestamps
             force_chunk_multi_channel: 2D array [chunk_size, num_channels]
+            fz_filtered_chunk: Optional 1D array of forward-filtered summed force
+            fz_chunk: Optional 1D array of summed force; summed here if omitted
         """
         # Validate input
         if force_chunk_multi_channel.shape[1] != self.num_channels:
             raise ValueError(f"Expected {self.num_channels} channels, got {force_chunk_multi_channel.shape[1]}")
         
-        # Store chunks for efficient retrieval
-        self._time_chunks.append(time_chunk)
-        self._force_chunks.append(force_chunk_multi_channel)
-        
-        # Add to circular buffers
-        self._time_buffer.extend(time_chunk)
-        
-        # Transpose for easier channel-wise storage
-        forces_by_channel = force_chunk_multi_channel.T
-        for i in range(self.num_channels):
-            self._force_buffers[i].extend(forces_by_channel[i])
+        # Copy into preallocated storage
+        num_samples = len(time_chunk)
+        if self._end + num_samples > self._capacity:
+            self._compact()
+        self._time_store[self._end:self._end + num_samples] = time_chunk
+        self._force_store[self._end:self._end + num_samples] = force_chunk_multi_channel
+        if fz_chunk is None:
+            fz_chunk = np.sum(force_chunk_multi_channel, axis=1)
+        self._fz_store[self._end:self._end + num_samples] = fz_chunk
+        if fz_filtered_chunk is not None:
+            self._fz_filtered_store[self._end:self._end + num_samples] = fz_filtered_chunk
+        self._end += num_samples
+        self._total_samples += num_samples
+        
+        # Discard the oldest samples beyond the retention window
+        self._start = max(self._start, self._end - self.max_samples)
             
     def get_full_data(self):
         """
@@ -78,17 +102,62 @@ class BufferManager:
             tuple: (time_array, force_array_multi_channel) or (None, None) if empty
                    time_array: 1D array of timestamps
                    force_array_multi_channel: 2D array [samples, channels]
+            Both are read-only views, valid until the next append; callers that keep
+            the data across an acquisition must copy it.
         """
-        if not self._time_buffer:
+        if self._end == self._start:
             return None, None
             
-        # Convert deques to numpy arrays
-        time_array = np.array(self._time_buffer)
+        time_array = self._time_store[self._start:self._end]
+        force_array = self._force_store[self._start:self._end]
+        time_array.flags.writeable = False
+        force_array.flags.writeable = False
+        return time_array, force_array
         
-        # Stack channel data into 2D array
-        force_array = np.column_stack([np.array(buffer) for buffer in self._force_buffers])
+    def get_time_data(self):
+        """
+        Get the timestamps for the retained window without copying.
         
-        return time_array, force_array
+        Returns:
+            Read-only 1D view aligned with get_full_data() rows, or None if empty.
+            The view is only valid until the next append.
+        """
+        if self._end == self._start:
+            return None
+            
+        time_array = self._time_store[self._start:self._end]
+        time_array.flags.writeable = False
+        return time_array
+        
+    def get_summed_force(self):
+        """
+        Get the summed force (Fz) for the retained window.
+        
+        Returns:
+            Read-only 1D view aligned with get_full_data() rows, or None if empty.
+            The view is only valid until the next append.
+        """
+        if self._end == self._start:
+            return None
+            
+        fz = self._fz_store[self._start:self._end]
+        fz.flags.writeable = False
+        return fz
+        
+    def get_filtered_fz(self):
+        """
+        Get the forward-filtered summed force for the retained window.
+        
+        Returns:
+            Read-only 1D view aligned with get_full_data() rows, or None if empty.
+            The view is only valid until the next append.
+        """
+        if self._end == self._start:
+            return None
+            
+        fz_filtered = self._fz_filtered_store[self._start:self._end]
+        fz_filtered.flags.writeable = False
+        return fz_filtered
         
     def get_recent_data(self, duration_seconds):
         """
@@ -100,20 +169,15 @@ class BufferManager:
         Returns:
             tuple: (time_array, force_array_multi_channel) or (None, None) if empty
         """
-        if not self._time_buffer:
+        if self._end == self._start:
             return None, None
             
         # Calculate how many samples to retrieve
-        num_samples = min(int(duration_seconds * self.sample_rate), len(self._time_buffer))
+        num_samples = min(int(duration_seconds * self.sample_rate), self._end - self._start)
         
         # Get recent samples from the end of buffers
-        time_array = np.array(list(self._time_buffer))[-num_samples:]
-        
-        # Stack channel data
-        force_arrays = []
-        for buffer in self._force_buffers:
-            force_arrays.append(np.array(list(buffer))[-num_samples:])
-        force_array = np.column_stack(force_arrays)
+        time_array = self._time_store[self._end - num_samples:self._end].copy()
+        force_array = self._force_store[self._end - num_samples:self._end].copy()
         
         return time_array, force_array
         
@@ -125,31 +189,23 @@ class BufferManager:
             num_samples: Number of recent samples to retrieve
             
         Returns:
-            1D array of summed forces or None if insufficient data
+            Read-only 1D view of summed forces (valid until the next append),
+            or None if insufficient data
         """
-        if len(self._time_buffer) < num_samples:
+        if self._end - self._start < num_samples:
             return None
             
-        # Get recent force data and sum across channels
-        force_arrays = []
-        for buffer in self._force_buffers:
-            force_arrays.append(np.array(list(buffer))[-num_samples:])
-        
-        # Sum across channels (axis=1 after stacking)
-        summed_force = np.sum(np.column_stack(force_arrays), axis=1)
-        
-        return summed_force
+        fz = self._fz_store[self._end - num_samples:self._end]
+        fz.flags.writeable = False
+        return fz
         
     def get_buffer_size(self):
         """Get current number of samples in buffers."""
-        return len(self._time_buffer)
+        return self._end - self._start
         
-    def get_chunks_for_analysis(self):
+    def get_first_sample_index(self):
         """
-        Get stored chunks for efficient batch analysis.
-        Returns the raw chunks as they were appended.
-        
-        Returns:
-            tuple: (time_chunks_list, force_chunks_list)
+        Get the sample index (counted since reset) of the oldest retained sample.
+        Subtract it from a sample index to get the row in get_full_data() arrays.
         """
-        return self._time_chunks.copy(), self._force_chunks.copy()
\ No newline at end of file
+        return self._total_samples - (self._end - self._start)
@@ -7,6 +7,50 @@ from PyQt6.QtCore import QObject, pyqtSignal
 import config
 
 
+class _RecentSamples:
+    """
+    Ring of the force samples from the most recent `window_chunks` chunks for the
+    stability checks. Capacity is sized from the length of the chunks actually received.
+    Sample order is not preserved, which is fine for the order-independent std/mean.
+    """
+    
+    def __init__(self, window_chunks):
+        self._window_chunks = window_chunks
+        self._chunk_len = 0  # Chunk length the ring is currently sized for
+        self._data = np.empty(0, dtype=np.float64)
+        self._pos = 0    # Next write position
+        self._size = 0   # Valid samples, up to capacity
+        self.chunk_count = 0  # Chunks appended since the last clear
+        
+    def clear(self):
+        self._pos = 0
+        self._size = 0
+        self.chunk_count = 0
+        
+    def append(self, chunk):
+        if len(chunk) != self._chunk_len:
+            if len(chunk) == 0:
+                return
+            # First chunk, or the acquisition chunk size changed: resize to hold
+            # window_chunks chunks of the new length (older samples are dropped)
+            self._chunk_len = len(chunk)
+            self._data = np.empty(self._window_chunks * self._chunk_len, dtype=np.float64)
+            self._pos = 0
+            self._size = 0
+        capacity = self._data.shape[0]
+        chunk = chunk[-capacity:]
+        n = len(chunk)
+        first = min(n, capacity - self._pos)
+        self._data[self._pos:self._pos + first] = chunk[:first]
+        self._data[:n - first] = chunk[first:]
+        self._pos = (self._pos + n) % capacity
+        self._size = min(self._size + n, capacity)
+        self.chunk_count += 1
+        
+    def std(self):
+        return np.std(self._data[:self._size])
+
+
 class CalibrationManager(QObject):
     """
     Manages the bodyweight calibration process with a state machine.
@@ -25,6 +69,8 @@ class CalibrationManager(QObject):
     PHASE_READY = 3      # Bodyweight measured, ready for jump
     PHASE_COMPLETED = 4  # Jump completed, analyzing
     
+    STABILITY_WINDOW_CHUNKS = 10  # Recent chunks used for the standing-still checks
+    
     def __init__(self, calibration_duration=3):
         """
         Initialize calibration manager.
@@ -40,8 +86,15 @@ class CalibrationManager(QObject):
         # State variables
         self.test_phase = self.PHASE_WAITING
         self._calibration_start_time = None
-        self._calibration_force_buffer = []
-        self._stability_buffer = []  # Buffer for stability detection before calibration
+        # Only the most recent STABILITY_WINDOW_CHUNKS chunks of samples are kept for the
+        # stability checks, in rings preallocated once the chunk length is known
+        self._calibration_force_buffer = _RecentSamples(self.STABILITY_WINDOW_CHUNKS)
+        self._stability_buffer = _RecentSamples(self.STABILITY_WINDOW_CHUNKS)  # Buffer for stability detection before calibration
+        
+        # Running mean/variance over all calibration samples, so completion needs no concatenation
+        self._cal_count = 0
+        self._cal_mean = 0.0
+        self._cal_m2 = 0.0
         
         # Results
         self._estimated_body_weight = None
@@ -53,8 +106,9 @@ class CalibrationManager(QObject):
         """Reset calibration state to initial values."""
         self.test_phase = self.PHASE_WAITING
         self._calibration_start_time = None
-        self._calibration_force_buffer = []
-        self._stability_buffer = []
+        self._calibration_force_buffer.clear()
+        self._stability_buffer.clear()
+        self._reset_calibration_stats()
         self._estimated_body_weight = None
         self._bw_calibration_std = None
         self._calibration_complete_time = None
@@ -62,6 +116,25 @@ class CalibrationManager(QObject):
         
         self.calibration_status_signal.emit("Step on the force plate", 0)
         
+    def _reset_calibration_stats(self):
+        """Clear the running calibration statistics."""
+        self._cal_count = 0
+        self._cal_mean = 0.0
+        self._cal_m2 = 0.0
+        
+    def _accumulate_calibration(self, fz_chunk):
+        """Fold a chunk into the running calibration mean/variance (chunked Welford update)."""
+        chunk_count = len(fz_chunk)
+        if chunk_count == 0:
+            return
+        chunk_mean = float(np.mean(fz_chunk))
+        chunk_m2 = float(np.var(fz_chunk)) * chunk_count
+        total = self._cal_count + chunk_count
+        delta = chunk_mean - self._cal_mean
+        self._cal_mean += delta * chunk_count / total
+        self._cal_m2 += chunk_m2 + delta * delta * self._cal_count * chunk_count / total
+        self._cal_count = total
+        
     def process_chunk(self, time_chunk, fz_chunk_summed, current_buffer_length):
         """
         Process a chunk of summed force data for calibration.
@@ -82,7 +155,8 @@ class CalibrationManager(QObject):
             if mean_force > self._significant_force_threshold:
                 # Person stepped on the plate - wait for stability before starting timer
                 self.test_phase = self.PHASE_WAITING_FOR_STABILITY
-                self._stability_buffer = [fz_chunk_summed]
+                self._stability_buffer.clear()
+                self._stability_buffer.append(fz_chunk_summed)
                 self.status_signal.emit("Person detected on force plate. Please stand still.")
                 self.calibration_status_signal.emit("Stand still to begin calibration", 0)
                 phase_changed = True
@@ -93,7 +167,7 @@ class CalibrationManager(QObject):
             if mean_force < self._significant_force_threshold:
                 # Person stepped off - go back to waiting
                 self.test_phase = self.PHASE_WAITING
-                self._stability_buffer = []
+                self._stability_buffer.clear()
                 self.status_signal.emit("Person stepped off. Step on the plate to begin.")
                 self.calibration_status_signal.emit("Step on force plate to begin test", 0)
                 phase_changed = True
@@ -102,15 +176,15 @@ class CalibrationManager(QObject):
                 self._stability_buffer.append(fz_chunk_summed)
                 
                 # Check for stability once we have enough data
-                if len(self._stability_buffer) >= 3:  # Need at least 3 chunks (~100ms) for stability check
-                    # Keep only recent data for stability analysis
-                    recent_data = np.concatenate(self._stability_buffer[-10:]) if len(self._stability_buffer) > 10 else np.concatenate(self._stability_buffer)
-                    std_dev = np.std(recent_data)
+                if self._stability_buffer.chunk_count >= 3:  # Need at least 3 chunks (~100ms) for stability check
+                    # The buffer only holds recent data for stability analysis
+                    std_dev = self._stability_buffer.std()
                     
                     if std_dev <= 10:  # Person is stable - start calibration timer
                         self.test_phase = self.PHASE_CALIBRATING
                         self._calibration_start_time = time_chunk[-1]
-                        self._calibration_force_buffer = []
+                        self._calibration_force_buffer.clear()
+                        self._reset_calibration_stats()
                         self.status_signal.emit("Stability detected. Starting bodyweight calibration.")
                         self.calibration_status_signal.emit("Stand still for calibration", self._calibration_duration)
                         phase_changed = True
@@ -120,8 +194,9 @@ class CalibrationManager(QObject):
         
         # STATE: Calibrating bodyweight - countdown
         elif self.test_phase == self.PHASE_CALIBRATING:
-            # Add the current chunk to calibration buffer
+            # Add the current chunk to calibration buffer and running statistics
             self._calibration_force_buffer.append(fz_chunk_summed)
+            self._accumulate_calibration(fz_chunk_summed)
             
             # Calculate elapsed time in calibration
             elapsed = time_chunk[-1] - self._calibration_start_time
@@ -129,13 +204,15 @@ class CalibrationManager(QObject):
             countdown = int(remaining) + 1
             
             # Check if force is stable
-            if len(self._calibration_force_buffer) > 1:
-                recent_data = np.concatenate(self._calibration_force_buffer[-10:]) if len(self._calibration_force_buffer) > 10 else np.concatenate(self._calibration_force_buffer)
-                std_dev = np.std(recent_data)
+            if self._calibration_force_buffer.chunk_count > 1:
+                std_dev = self._calibration_force_buffer.std()
                 if std_dev > 10:  # Too much movement
                     # Reset calibration
                     self._calibration_start_time = time_chunk[-1]
-                    self._calibration_force_buffer = [fz_chunk_summed]
+                    self._calibration_force_buffer.clear()
+                    self._calibration_force_buffer.append(fz_chunk_summed)
+                    self._reset_calibration_stats()
+                    self._accumulate_calibration(fz_chunk_summed)
                     self.status_signal.emit("Please stand still for accurate bodyweight measurement")
                     self.calibration_status_signal.emit("Stand still! Restarting calibration", self._calibration_duration)
                     return False
@@ -146,10 +223,9 @@ class CalibrationManager(QObject):
             
             # Check if calibration is complete
             if elapsed >= self._calibration_duration:
-                # Calculate body weight from the collected data
-                all_calibration_data = np.concatenate(self._calibration_force_buffer)
-                self._estimated_body_weight = np.mean(all_calibration_data)
-                self._bw_calibration_std = np.std(all_calibration_data)  # Store std deviation for jump start detection
+                # Body weight from the running statistics of the collected data
+                self._estimated_body_weight = self._cal_mean
+                self._bw_calibration_std = np.sqrt(self._cal_m2 / self._cal_count)  # Store std deviation for jump start detection
                 
                 # Sanity check on bodyweight
                 if self._estimated_body_weight < 200:
@@ -12,14 +12,14 @@ while maintaining the exact same external interface.
 import numpy as np
 import time
 from PyQt6.QtCore import QObject, pyqtSignal, pyqtSlot, QTimer
-from scipy.signal import butter, filtfilt
+from scipy.signal import sosfilt, sosfilt_zi
 import config
 
 # Import the new modules
 from .buffer_manager import BufferManager
 from .calibration_manager import CalibrationManager
 from .jump_detector import JumpDetector
-from .jump_analyzer import JumpAnalyzer
+from .jump_analyzer import JumpAnalyzer, design_filter_sos, nearest_index, result_key, RESULT_PEAK_BRAKING
 
 
 class DataProcessor(QObject):
@@ -53,12 +53,26 @@ class DataProcessor(QObject):
         
         # For timing compensation
         self._last_force_data = None
+        
+        # Low-pass for this processor's rate, shared by the display filter, the backward
+        # analysis pass and the analyzer. Display state carried across chunks has shape
+        # (n_sections, 2, num_channels).
+        self._filter_sos = design_filter_sos(self.sample_rate)
+        self._filter_zi = None
+        
+        # Reused per-chunk force array (BufferManager copies what it stores) and the
+        # weights for summing channels with one matrix-vector product
+        self._force_workspace = None
+        self._channel_ones = np.ones(self.num_channels)
+        
+        # Per-sample time offsets within a chunk (seconds), keyed by chunk length
+        self._time_offset_cache = {}
 
         # Initialize specialized modules
         self._buffer_manager = BufferManager(sample_rate, num_channels)
         self._calibration_manager = CalibrationManager()
         self._jump_detector = JumpDetector(sample_rate)
-        self._jump_analyzer = JumpAnalyzer(sample_rate)
+        self._jump_analyzer = JumpAnalyzer(sample_rate, filter_sos=self._filter_sos)
         
         # Connect signals from modules to forward them
         self._connect_module_signals()
@@ -81,17 +95,6 @@ class DataProcessor(QObject):
             'avg_processing_time': 0   # Running average processing time
         }
         self._expected_chunk_interval = config.DAQ_READ_CHUNK_SIZE / self.sample_rate
-        
-        # Initialize Butterworth filter for plot display
-        nyquist = self.sample_rate / 2.0
-        fc = min(config.FILTER_CUTOFF, nyquist * 0.99)
-        self._filter_b, self._filter_a = butter(
-            config.FILTER_ORDER,
-            fc,
-            btype='low',
-            analog=False,
-            fs=self.sample_rate
-        )
 
     def _connect_module_signals(self):
         """Connect signals from internal modules to forward them through this class."""
@@ -130,7 +133,8 @@ class DataProcessor(QObject):
         """Stores the measured zero offset voltages."""
         if offset_voltages is not None and offset_voltages.shape == (self.num_channels,):
             self.zero_offset_v = offset_voltages
-            self.status_signal.emit(f"Zero offset updated: {np.round(offset_voltages, 3)} V")
+            offset_text = " ".join(f"{v:.3f}" for v in offset_voltages)
+            self.status_signal.emit(f"Zero offset updated: [{offset_text}] V")
         else:
             self.status_signal.emit(f"Invalid offset voltages received. Shape: {offset_voltages.shape if offset_voltages is not None else 'None'}")
 
@@ -140,6 +144,7 @@ class DataProcessor(QObject):
         self._buffer_manager.reset()
         self._calibration_manager.reset()
         self._jump_detector.reset()
+        self._filter_zi = None
         
         # Reset real-time tracking
         self._last_real_time = None
@@ -207,9 +212,13 @@ class DataProcessor(QObject):
         sample_start = self._total_samples_processed
         self._total_samples_processed += num_samples
         
-        # Calculate precise timestamps based on sample rate
-        time_chunk = self._acquisition_start_time + np.arange(sample_start, sample_start + num_samples) / self.sample_rate
-        num_samples_in_chunk = num_samples
+        # Calculate precise timestamps based on sample rate: a cached offset ramp shifted
+        # by the chunk's start time, instead of a fresh arange and division per chunk
+        time_offsets = self._time_offset_cache.get(num_samples)
+        if time_offsets is None:
+            time_offsets = np.arange(num_samples) / self.sample_rate
+            self._time_offset_cache[num_samples] = time_offsets
+        time_chunk = time_offsets + (self._acquisition_start_time + sample_start / self.sample_rate)
         
         # Calculate effective sample rate for this chunk
         if previous_real_time is not None:
@@ -218,14 +227,16 @@ class DataProcessor(QObject):
                 effective_rate = num_samples / actual_duration
                 self._timing_stats['effective_rates'].append(effective_rate)
 
-        # 1. Apply Zero Offset
-        offset_corrected_data = raw_data_chunk - self.zero_offset_v
+        # 1. Apply Zero Offset into the reused working array (no per-chunk allocation)
+        if self._force_workspace is None or self._force_workspace.shape != raw_data_chunk.shape:
+            self._force_workspace = np.empty(raw_data_chunk.shape)
+        force_data_channels = np.subtract(raw_data_chunk, self.zero_offset_v, out=self._force_workspace)
         
-        # Store latest voltage sum for calibration (after zero offset)
-        self._latest_voltage_sum = np.sum(offset_corrected_data[-1])  # Sum of all channels, last sample
+        # Store latest voltage sum for calibration (after zero offset, before scaling)
+        self._latest_voltage_sum = np.sum(force_data_channels[-1])  # Sum of all channels, last sample
 
-        # 2. Scale to Force (Newtons per channel)
-        force_data_channels = offset_corrected_data * self.n_per_volt
+        # 2. Scale to Force (Newtons per channel) in place - no second temporary
+        np.multiply(force_data_channels, self.n_per_volt, out=force_data_channels)
         
         # Note: Removed gap compensation - delivery timing jitter doesn't indicate missing samples
         # Hardware DAQ samples at precise intervals regardless of Python delivery timing
@@ -236,13 +247,18 @@ class DataProcessor(QObject):
         else:
             self._last_force_data = None
 
-        # 3. Calculate Total Vertical Force (Fz) for detection
-        fz_chunk_summed = np.sum(force_data_channels, axis=1)
+        # 3. Calculate Total Vertical Force (Fz) for detection; the matvec sums rows in one
+        # pass. The buffer manager and calibration manager copy the samples they keep.
+        fz_chunk_summed = force_data_channels @ self._channel_ones
 
-        # 4. Apply 50Hz filter to data for plotting
-        force_data_filtered = np.zeros_like(force_data_channels)
-        for ch in range(force_data_channels.shape[1]):
-            force_data_filtered[:, ch] = filtfilt(self._filter_b, self._filter_a, force_data_channels[:, ch])
+        # 4. Apply 50Hz filter to data for plotting (all channels in one call). The filter
+        # state carries over between chunks so there is no transient at chunk boundaries.
+        if self._filter_zi is None:
+            # Start in steady state at the first sample of each channel
+            self._filter_zi = sosfilt_zi(self._filter_sos)[:, :, np.newaxis] * force_data_channels[0]
+        force_data_filtered, self._filter_zi = sosfilt(
+            self._filter_sos, force_data_channels, axis=0, zi=self._filter_zi
+        )
 
         # 5. Convert to relative time for plotting (seconds since start)
         relative_time_chunk = time_chunk - self._acquisition_start_time
@@ -269,8 +285,13 @@ class DataProcessor(QObject):
                 f"max={self._timing_stats['max_processing_time']:.1f}ms"
             )
 
-        # 5. Append to buffers
-        self._buffer_manager.append_chunk(time_chunk, force_data_channels)
+        # 5. Append to buffers, with the filtered Fz (filter is linear, so summing the
+        # filtered channels equals filtering the sum) for the post-jump analysis
+        fz_chunk_filtered = np.sum(force_data_filtered, axis=1)
+        self._buffer_manager.append_chunk(
+            time_chunk, force_data_channels,
+            fz_filtered_chunk=fz_chunk_filtered, fz_chunk=fz_chunk_summed
+        )
         current_buffer_length = self._buffer_manager.get_buffer_size()
         
         # 6. Process calibration state machine
@@ -280,16 +301,15 @@ class DataProcessor(QObject):
         
         # 7. Perform jump detection if calibration is ready
         if self._calibration_manager.is_ready_for_jump():
-            # Get buffer data for jump detection
-            time_chunks, force_chunks = self._buffer_manager.get_chunks_for_analysis()
-            if time_chunks and force_chunks:
-                jump_detected, jump_info = self._jump_detector.process_chunk(
-                    time_chunks, force_chunks, num_samples_in_chunk
-                )
-                
-                if jump_detected:
-                    # Mark calibration phase as completed
-                    self._calibration_manager.set_completed()
+            # Recent Fz for jump detection, read from the stored sums
+            recent_fz = self._buffer_manager.get_summed_force_history(self._jump_detector.history_samples)
+            jump_detected, jump_info = self._jump_detector.process_chunk(
+                recent_fz, self._total_samples_processed
+            )
+            
+            if jump_detected:
+                # Mark calibration phase as completed
+                self._calibration_manager.set_completed()
 
     def _on_jump_detected(self, jump_number, takeoff_index, landing_index):
         """Handle jump detection by triggering analysis."""
@@ -307,29 +327,42 @@ class DataProcessor(QObject):
     def get_full_data(self):
         """Returns the complete collected data as NumPy arrays.
         Returns: (full_time [1D], full_force_multi_channel [2D: samples, channels])
+        as read-only views of the buffers, valid until acquisition appends new data.
         """
         return self._buffer_manager.get_full_data()
 
+    def get_sample_count(self):
+        """Returns the number of buffered samples without copying any data."""
+        return self._buffer_manager.get_buffer_size()
+
     def _compute_basic_metrics(self, jump_number, takeoff_index, landing_index):
         """Compute all jump metrics except braking, then emit full-results dict."""
-        full_time, full_multi = self.get_full_data()
-        if full_time is None or full_multi is None:
+        # Views of the retained window; only the analysis window is sliced out of them
+        full_time = self._buffer_manager.get_time_data()
+        fz_full = self._buffer_manager.get_summed_force()
+        if full_time is None or fz_full is None:
+            return
+            
+        # Detector indices count samples since reset; convert them to rows of the
+        # retained window, which drops the oldest samples in long sessions
+        first_index = self._buffer_manager.get_first_sample_index()
+        takeoff_index = max(0, takeoff_index - first_index)
+        landing_index -= first_index
+        if landing_index < 0:
             return
             
-        # Sum to get Fz
-        fz_full = np.sum(full_multi, axis=1)
-        
         # Define segment window: 1s before takeoff to landing
         if full_time is not None and len(full_time) > takeoff_index:
             takeoff_time = full_time[takeoff_index]
             window_start_time = takeoff_time - 1.0
-            start_idx = max(0, np.abs(full_time - window_start_time).argmin())
+            start_idx = nearest_index(full_time, window_start_time)
         else:
             start_idx = max(0, takeoff_index - int(1.0 * self.sample_rate))
             
         end_idx = landing_index + 1
         time_seg = full_time[start_idx:end_idx]
         fz_seg = fz_full[start_idx:end_idx]
+        fz_seg_filtered = self._zero_phase_filtered_fz(start_idx, end_idx)
         
         # Get calibration data
         body_weight = self._calibration_manager.get_bodyweight()
@@ -339,35 +372,55 @@ class DataProcessor(QObject):
         # Perform full analysis on this segment
         results = self._jump_analyzer.analyze_jump_segment(
             time_seg, fz_seg, jump_number,
-            body_weight, calibration_std, calibration_complete_time
+            body_weight, calibration_std, calibration_complete_time,
+            fz_filtered=fz_seg_filtered
         )
         
         # Zero braking peak until later update
-        results[f'Jump #{jump_number} Peak Braking Force (N)'] = 0.0
+        results[result_key(jump_number, RESULT_PEAK_BRAKING)] = 0.0
         
         # Emit immediate results
         self.analysis_complete_signal.emit(results)
 
+    def _zero_phase_filtered_fz(self, start_idx, end_idx):
+        """
+        Complete the zero-phase filter for rows [start_idx:end_idx] of the retained window.
+        The forward pass already ran chunk by chunk during acquisition, so only the
+        backward pass is left. It starts from the newest sample, so the samples recorded
+        after the segment settle the filter instead of artificial edge padding.
+        """
+        fz_forward = self._buffer_manager.get_filtered_fz()
+        if fz_forward is None or end_idx > len(fz_forward) or start_idx >= end_idx:
+            return None
+            
+        tail = fz_forward[start_idx:][::-1].astype(np.float64)
+        backward, _ = sosfilt(self._filter_sos, tail, zi=sosfilt_zi(self._filter_sos) * tail[0])
+        return backward[::-1][:end_idx - start_idx]
+        
     def _compute_braking_peak(self, jump_number, landing_index):
         """Compute and emit only the braking peak after landing."""
-        full_time, full_multi = self.get_full_data()
-        if full_time is None or full_multi is None:
+        full_time = self._buffer_manager.get_time_data()
+        fz_full = self._buffer_manager.get_summed_force()
+        if full_time is None or fz_full is None:
+            return
+            
+        # Convert from samples-since-reset to a row of the retained window
+        landing_index -= self._buffer_manager.get_first_sample_index()
+        if landing_index < 0:
             return
             
-        fz_full = np.sum(full_multi, axis=1)
-        
         # Use wall-clock timing to find the braking window (300ms after landing)
         if len(full_time) > landing_index:
             landing_time = full_time[landing_index]
             window_end_time = landing_time + 0.3
-            end_idx = min(np.abs(full_time - window_end_time).argmin(), len(fz_full))
+            end_idx = min(nearest_index(full_time, window_end_time), len(fz_full))
         else:
             window_samples = int(0.3 * self.sample_rate)
             end_idx = min(landing_index + window_samples, len(fz_full))
             
         # Slice the braking window
         start_idx = landing_index
-        braking_peak = float(np.max(fz_full[start_idx:end_idx])) if start_idx < end_idx else 0.0
+        braking_peak = float(fz_full[start_idx:end_idx].max()) if start_idx < end_idx else 0.0
         self.status_signal.emit(
             f"Computed braking peak for Jump #{jump_number}: {braking_peak:.2f} N"
         )
@@ -2,11 +2,78 @@
 Post-jump analysis of force plate data.
 Performs detailed analysis including filtering, event detection, and metrics calculation.
 """
+import logging
 import numpy as np
-from scipy.signal import butter, filtfilt
+from scipy.signal import butter, sosfiltfilt
 from PyQt6.QtCore import QObject, pyqtSignal
 import config
 
+logger = logging.getLogger(__name__)
+
+# Result key suffixes: every key in a results dict is result_key(jump_number, suffix)
+RESULT_BODY_WEIGHT = 'Body Weight (N)'
+RESULT_PEAK_PROPULSIVE = 'Peak Propulsive Force (N)'
+RESULT_PEAK_BRAKING = 'Peak Braking Force (N)'
+RESULT_FLIGHT_TIME = 'Flight Time (s)'
+RESULT_HEIGHT_FLIGHT = 'Jump Height (Flight Time) (m)'
+RESULT_HEIGHT_IMPULSE = 'Jump Height (Impulse) (m)'
+RESULT_NET_IMPULSE = 'Net Impulse (Ns)'
+RESULT_CONTRACTION_TIME = 'Contraction Time (ms)'
+RESULT_NOTE = 'Analysis Note'
+RESULT_ERROR = 'Error'
+
+
+def result_key(jump_number, suffix):
+    """Results dict key for a metric of the given jump, e.g. 'Jump #2 Flight Time (s)'."""
+    return f'Jump #{jump_number} {suffix}'
+
+
+def design_filter_sos(sample_rate):
+    """
+    Low-pass Butterworth (config.FILTER_ORDER, config.FILTER_CUTOFF) as second-order
+    sections for the given rate. config.FILTER_SOS is reused when the rate is
+    config.SAMPLE_RATE, since it was designed for exactly that rate.
+    """
+    if sample_rate == config.SAMPLE_RATE:
+        return config.FILTER_SOS
+    fc = min(config.FILTER_CUTOFF, sample_rate / 2.0 * 0.99)
+    return butter(config.FILTER_ORDER, fc, btype='low', output='sos', fs=sample_rate)
+
+
+def nearest_index(sorted_times, target):
+    """
+    Index of the timestamp closest to target (the earlier one on a tie), by binary
+    search on the increasing timestamps instead of a full |t - target| scan.
+    """
+    j = int(np.searchsorted(sorted_times, target))
+    if j == 0:
+        return 0
+    if j == len(sorted_times):
+        return j - 1
+    return j if sorted_times[j] - target < target - sorted_times[j - 1] else j - 1
+
+# np.trapz was renamed np.trapezoid in NumPy 2.0 (and the old name later removed)
+try:
+    _trapezoid = np.trapezoid
+except AttributeError:
+    _trapezoid = np.trapz
+
+
+def _trapz_fast(y, x):
+    """
+    Trapezoidal integral of y over x. Timestamps are generated from sample counts, so
+    the spacing is uniform up to float rounding and the integral reduces to one sum;
+    anything else falls back to the general trapezoid rule.
+    """
+    n = len(y)
+    if n < 2:
+        return 0.0
+    dt = (x[-1] - x[0]) / (n - 1)
+    # Rounding of absolute (epoch) timestamps perturbs each step by ~1e-7 s
+    if dt > 0 and np.max(np.abs(np.diff(x) - dt)) <= 1e-3 * dt:
+        return dt * (np.sum(y, dtype=np.float64) - 0.5 * (float(y[0]) + float(y[-1])))
+    return float(_trapezoid(y, x))
+
 
 class JumpAnalyzer(QObject):
     """
@@ -19,35 +86,45 @@ class JumpAnalyzer(QObject):
     jump_event_markers_signal = pyqtSignal(dict)  # Dictionary with event times and forces
     status_signal = pyqtSignal(str)
     
-    def __init__(self, sample_rate):
+    def __init__(self, sample_rate, filter_sos=None):
         """
         Initialize jump analyzer.
         
         Args:
             sample_rate: Sampling rate in Hz
+            filter_sos: Low-pass SOS designed for sample_rate (default: design_filter_sos)
         """
         super().__init__()
         
         self.sample_rate = sample_rate
         
-        # Butterworth filter parameters
-        nyquist = self.sample_rate / 2.0
-        fc = min(config.FILTER_CUTOFF, nyquist * 0.99)
-        self._filter_b, self._filter_a = butter(
-            config.FILTER_ORDER,
-            fc,
-            btype='low',
-            analog=False,
-            fs=self.sample_rate
-        )
+        # Butterworth filter for this analyzer's rate, as normalized second-order sections.
+        # Padding matches what filtfilt derived on every call from the (b, a) form.
+        self._filter_sos = filter_sos if filter_sos is not None else design_filter_sos(self.sample_rate)
+        self._filtfilt_padlen = 3 * (config.FILTER_ORDER + 1)
         
-        # Interpolation results for precise timing
-        self._takeoff_idx_precise = None
-        self._landing_idx_precise = None
+        # Analysis windows in samples. Timestamps are generated from sample counts, so the
+        # nominal rate is the effective rate and these never change between segments.
+        self._braking_window_samples = int(0.5 * self.sample_rate)
+        self._landing_search_samples = int(0.2 * self.sample_rate)
+        self._landing_min_gap_samples = int(0.05 * self.sample_rate)
+        self._onset_buffer_samples = int(0.1 * self.sample_rate)
+        
+        # Block length for the early-exit onset scan (100 ms)
+        self._onset_block_samples = max(1, int(0.1 * self.sample_rate))
+        
+        # Thresholds derived from the calibration, shared by all jumps until it changes
+        self._calibration_key = None
+        self._calibration_constants = None
+        
+        # Interpolation results for precise timing (-1.0 = not available)
+        self._takeoff_idx_precise = -1.0
+        self._landing_idx_precise = -1.0
         self._flight_time_precise = None
         
     def analyze_jump_segment(self, time_data_absolute, fz_data, jump_number, 
-                           body_weight_n, calibration_std, calibration_complete_time):
+                           body_weight_n, calibration_std, calibration_complete_time,
+                           fz_filtered=None):
         """
         Performs analysis on a specific segment of SUMMED Fz data representing one jump.
         
@@ -58,52 +135,78 @@ class JumpAnalyzer(QObject):
             body_weight_n: Calibrated bodyweight in N
             calibration_std: Standard deviation from calibration
             calibration_complete_time: Time when calibration was completed
+            fz_filtered: Optional zero-phase filtered fz_data; filtered here if omitted
             
         Returns:
             dict: Analysis results with metrics
         """
+        # Result keys for this jump, formatted once
+        bw_key = result_key(jump_number, RESULT_BODY_WEIGHT)
+        propulsive_key = result_key(jump_number, RESULT_PEAK_PROPULSIVE)
+        braking_key = result_key(jump_number, RESULT_PEAK_BRAKING)
+        flight_time_key = result_key(jump_number, RESULT_FLIGHT_TIME)
+        height_flight_key = result_key(jump_number, RESULT_HEIGHT_FLIGHT)
+        height_impulse_key = result_key(jump_number, RESULT_HEIGHT_IMPULSE)
+        note_key = result_key(jump_number, RESULT_NOTE)
+        contraction_key = result_key(jump_number, RESULT_CONTRACTION_TIME)
+        error_key = result_key(jump_number, RESULT_ERROR)
+        
         results = {
-            f'Jump #{jump_number} Body Weight (N)': 'N/A',
-            f'Jump #{jump_number} Peak Propulsive Force (N)': 0,
-            f'Jump #{jump_number} Peak Braking Force (N)': 0,
-            f'Jump #{jump_number} Flight Time (s)': 0,
-            f'Jump #{jump_number} Jump Height (Flight Time) (m)': 0,
-            f'Jump #{jump_number} Jump Height (Impulse) (m)': 0,
-            f'Jump #{jump_number} Analysis Note': ''
+            bw_key: 'N/A',
+            propulsive_key: 0,
+            braking_key: 0,
+            flight_time_key: 0,
+            height_flight_key: 0,
+            height_impulse_key: 0,
+            note_key: ''
         }
         
-        # Initialize critical variables
+        # Initialize critical variables; precise indices from a previous segment must not
+        # leak into this one (manual detection does not interpolate)
+        self._takeoff_idx_precise = -1.0
+        self._landing_idx_precise = -1.0
         movement_start_idx_abs = 0
         first_takeoff_idx = None
         first_landing_idx = 0
+        notes = []  # Joined into the Analysis Note once at the end
         
         if (time_data_absolute is None or fz_data is None or 
             len(time_data_absolute) < config.MIN_CONTACT_SAMPLES + config.MIN_FLIGHT_SAMPLES):
             note = "Not enough data for analysis."
-            results[f'Jump #{jump_number} Analysis Note'] = note
+            results[note_key] = note
             
             # Clean up keys for failed analysis
-            keys_to_remove = [k for k in results if k != f'Jump #{jump_number} Analysis Note']
+            keys_to_remove = [k for k in results if k != note_key]
             for k in keys_to_remove:
                 del results[k]
             return results
             
         try:
-            # 1. Filter the Force Data
-            fz_filtered = filtfilt(self._filter_b, self._filter_a, fz_data)
+            # 1. Filter the Force Data (unless the caller already has it filtered)
+            if fz_filtered is None or len(fz_filtered) != len(fz_data):
+                fz_filtered = sosfiltfilt(
+                    self._filter_sos, fz_data, padtype='odd', padlen=self._filtfilt_padlen
+                )
+            
+            # Threshold scans and integration work on float32 forces (well below the ADC
+            # resolution), halving the bytes moved; scalar results are Python floats
+            fz_data = np.ascontiguousarray(fz_data, dtype=np.float32)
+            fz_filtered = np.ascontiguousarray(fz_filtered, dtype=np.float32)
             
             # 2. Use provided bodyweight
-            results[f'Jump #{jump_number} Body Weight (N)'] = round(body_weight_n, 2)
+            results[bw_key] = round(body_weight_n, 2)
             
             # 3. Detect Flight Events
-            flight_threshold = max(config.BODYWEIGHT_THRESHOLD_N, body_weight_n * 0.2)
+            flight_threshold, movement_threshold, mass = self._get_calibration_constants(
+                body_weight_n, calibration_std
+            )
             takeoff_indices, landing_indices = self._find_flight_phases(fz_data, fz_filtered, flight_threshold)
             
             flight_detected = takeoff_indices.size > 0 and landing_indices.size > 0
             
             if not flight_detected:
                 # Try manual detection
-                results[f'Jump #{jump_number} Analysis Note'] += " Incomplete/No flight phase. Searching manually..."
+                notes.append("Incomplete/No flight phase. Searching manually...")
                 takeoff_indices, landing_indices = self._manual_flight_detection(fz_filtered, flight_threshold)
                 flight_detected = takeoff_indices.size > 0 and landing_indices.size > 0
                 
@@ -113,87 +216,84 @@ class JumpAnalyzer(QObject):
                 valid_landing_indices = landing_indices[landing_indices > first_takeoff_idx]
                 
                 if valid_landing_indices.size == 0:
-                    results[f'Jump #{jump_number} Analysis Note'] += " Takeoff no landing."
+                    notes.append("Takeoff no landing.")
                 else:
                     first_landing_idx = valid_landing_indices[0]
                     
                     # Calculate peak forces
-                    propulsive_peak = np.max(fz_data[:first_takeoff_idx]) if first_takeoff_idx > 0 else 0.0
+                    propulsive_peak = float(np.max(fz_data[:first_takeoff_idx])) if first_takeoff_idx > 0 else 0.0
                     
                     # Braking window calculation
-                    braking_window_samples = self._find_time_window_samples(time_data_absolute, 0.5)
-                    braking_end_idx = min(first_landing_idx + braking_window_samples, len(fz_data))
-                    braking_peak = np.max(fz_data[first_landing_idx:braking_end_idx]) if first_landing_idx < braking_end_idx else 0.0
+                    braking_end_idx = min(first_landing_idx + self._braking_window_samples, len(fz_data))
+                    braking_peak = float(np.max(fz_data[first_landing_idx:braking_end_idx])) if first_landing_idx < braking_end_idx else 0.0
                     
-                    results[f'Jump #{jump_number} Peak Propulsive Force (N)'] = round(propulsive_peak, 2)
-                    results[f'Jump #{jump_number} Peak Braking Force (N)'] = round(braking_peak, 2)
+                    results[propulsive_key] = round(propulsive_peak, 2)
+                    results[braking_key] = round(braking_peak, 2)
                     
                     # Calculate flight time using precise interpolation
-                    flight_time = self._calculate_flight_time(time_data_absolute, first_takeoff_idx, first_landing_idx)
+                    takeoff_time, landing_time = self._event_wallclock_times(
+                        time_data_absolute, first_takeoff_idx, first_landing_idx
+                    )
+                    flight_time = landing_time - takeoff_time
                     
                     if flight_time < config.MIN_FLIGHT_TIME or flight_time > config.MAX_FLIGHT_TIME:
                         self.status_signal.emit(f"NOTICE: Flight time {flight_time:.3f}s outside expected range")
-                        results[f'Jump #{jump_number} Analysis Note'] += " Flight time outside typical range."
+                        notes.append("Flight time outside typical range.")
                         
-                    results[f'Jump #{jump_number} Flight Time (s)'] = round(flight_time, 3)
+                    results[flight_time_key] = round(flight_time, 3)
                     jump_height_m = (config.GRAVITY * flight_time**2) / 8.0
-                    results[f'Jump #{jump_number} Jump Height (Flight Time) (m)'] = round(jump_height_m, 3)
+                    results[height_flight_key] = round(jump_height_m, 3)
+                    
+                    # Force relative to bodyweight, shared by the onset search and impulse
+                    net_fz = fz_filtered - np.float32(body_weight_n)
+                    
+                    # Find movement start, used by the impulse, contraction time and markers
+                    movement_start_idx_abs = self._find_movement_start(
+                        net_fz, first_takeoff_idx,
+                        movement_threshold, calibration_complete_time, time_data_absolute
+                    )
                     
                     # Calculate impulse-based jump height
                     impulse_results = self._calculate_impulse_height(
-                        time_data_absolute, fz_filtered, first_takeoff_idx,
-                        body_weight_n, calibration_std, calibration_complete_time, jump_number
+                        time_data_absolute, net_fz, movement_start_idx_abs, first_takeoff_idx,
+                        body_weight_n, mass, jump_number
                     )
                     
                     if impulse_results:
                         results.update(impulse_results)
-                        
-                    # Find movement start for event markers
-                    movement_start_idx_abs = self._find_movement_start(
-                        fz_filtered, first_takeoff_idx, body_weight_n, 
-                        calibration_std, calibration_complete_time, time_data_absolute
-                    )
                     
                     # Calculate contraction time (time from jump start to takeoff)
                     if movement_start_idx_abs < len(time_data_absolute) and first_takeoff_idx < len(time_data_absolute):
                         jump_start_time = time_data_absolute[movement_start_idx_abs]
                         
-                        # Use precise interpolated takeoff time if available
-                        if hasattr(self, '_takeoff_idx_precise') and self._takeoff_idx_precise >= 0:
-                            takeoff_time = self._interpolated_index_to_wallclock_time(
-                                self._takeoff_idx_precise, time_data_absolute
-                            )
-                        else:
-                            takeoff_time = time_data_absolute[first_takeoff_idx]
-                        
-                        # Calculate contraction time in milliseconds
+                        # Calculate contraction time in milliseconds (precise takeoff time)
                         contraction_time_s = takeoff_time - jump_start_time
                         contraction_time_ms = contraction_time_s * 1000
                         
                         # Add to results
-                        results[f'Jump #{jump_number} Contraction Time (ms)'] = round(contraction_time_ms, 1)
+                        results[contraction_key] = round(contraction_time_ms, 1)
                     
                     # Emit event markers
                     self._emit_event_markers(
                         time_data_absolute, fz_filtered, jump_number,
-                        movement_start_idx_abs, first_takeoff_idx, first_landing_idx
+                        movement_start_idx_abs, first_takeoff_idx, first_landing_idx,
+                        takeoff_time, landing_time
                     )
                     
             # Clean up note
-            final_note = results[f'Jump #{jump_number} Analysis Note'].strip()
+            final_note = " ".join(notes)
             if not final_note:
-                del results[f'Jump #{jump_number} Analysis Note']
+                del results[note_key]
             else:
-                results[f'Jump #{jump_number} Analysis Note'] = final_note
+                results[note_key] = final_note
                 
             return results
             
         except Exception as e:
             self.status_signal.emit(f"Analysis failed for jump segment: {e}")
-            print(f"Analysis Error (Segment): {e}")
-            import traceback
-            traceback.print_exc()
-            results[f'Jump #{jump_number} Error'] = str(e)
+            logger.exception("Analysis error (segment): %s", e)
+            results[note_key] = " ".join(notes)
+            results[error_key] = str(e)
             return results
             
     def _find_flight_phases(self, fz_data, fz_filtered, threshold_n):
@@ -205,69 +305,57 @@ class JumpAnalyzer(QObject):
         transition_threshold = 50.0  # 50N for reliable transition detection
         
         # Find takeoff: first point where unfiltered force crosses below 20N
-        takeoff_idx = -1
-        for i in range(1, len(fz_data)):
-            if fz_data[i-1] >= flight_threshold and fz_data[i] < flight_threshold:
-                takeoff_idx = i
-                break
-                
-        if takeoff_idx == -1:
+        down_crossings = np.flatnonzero((fz_data[:-1] >= flight_threshold) & (fz_data[1:] < flight_threshold))
+        if down_crossings.size == 0:
             return np.array([]), np.array([])
+        takeoff_idx = int(down_crossings[0]) + 1
             
         # Find landing: filtered 50N crossing then backward search for unfiltered 20N
-        landing_50N_crossings = []
-        for i in range(takeoff_idx + 1, len(fz_filtered)):
-            if fz_filtered[i-1] < transition_threshold and fz_filtered[i] >= transition_threshold:
-                landing_50N_crossings.append(i)
-                break
-                
-        if not landing_50N_crossings:
-            self._interpolate_takeoff(fz_data, takeoff_idx, flight_threshold)
+        after_takeoff = fz_filtered[takeoff_idx:]
+        up_crossings = np.flatnonzero((after_takeoff[:-1] < transition_threshold) & (after_takeoff[1:] >= transition_threshold))
+        
+        if up_crossings.size == 0:
+            self._takeoff_idx_precise = self._interpolate_crossing(fz_data, takeoff_idx, flight_threshold)
             return np.array([takeoff_idx]), np.array([])
             
-        idx_50N_up = landing_50N_crossings[0]
+        idx_50N_up = takeoff_idx + int(up_crossings[0]) + 1
         
         # Search backward for 20N crossing
-        search_window_samples = min(int(0.2 * self.sample_rate), idx_50N_up - takeoff_idx)
-        min_gap_samples = int(0.05 * self.sample_rate)
-        search_start = max(takeoff_idx + min_gap_samples, idx_50N_up - search_window_samples)
+        search_window_samples = min(self._landing_search_samples, idx_50N_up - takeoff_idx)
+        search_start = max(takeoff_idx + self._landing_min_gap_samples, idx_50N_up - search_window_samples)
         
         landing_idx = idx_50N_up
         found_5N_landing_crossing = False
         
-        for i in range(idx_50N_up, search_start, -1):
-            if i > 0 and i < len(fz_data):
-                if fz_data[i-1] < flight_threshold and fz_data[i] >= flight_threshold:
-                    landing_idx = i
-                    found_5N_landing_crossing = True
-                    break
+        # Upward crossings in (search_start, idx_50N_up]; the last one is the one closest
+        # to the 50N crossing
+        window = fz_data[search_start:idx_50N_up + 1]
+        landing_crossings = np.flatnonzero((window[:-1] < flight_threshold) & (window[1:] >= flight_threshold))
+        if landing_crossings.size:
+            landing_idx = search_start + int(landing_crossings[-1]) + 1
+            found_5N_landing_crossing = True
                     
         # Perform interpolation for precise timing
-        self._interpolate_takeoff(fz_data, takeoff_idx, flight_threshold)
-        self._interpolate_landing(fz_data, landing_idx, flight_threshold, found_5N_landing_crossing)
+        self._takeoff_idx_precise, self._landing_idx_precise = (
+            self._interpolate_crossing(fz_data, takeoff_idx, flight_threshold),
+            self._interpolate_crossing(fz_data, landing_idx, flight_threshold)
+            if found_5N_landing_crossing else float(landing_idx)
+        )
         
         return np.array([takeoff_idx]), np.array([landing_idx])
         
     def _manual_flight_detection(self, fz_filtered, flight_threshold):
         """Manual detection when automatic detection fails."""
         below_threshold = fz_filtered < flight_threshold
-        flight_regions = []
-        in_flight = False
-        flight_start = 0
-        
-        for i, is_below in enumerate(below_threshold):
-            if not in_flight and is_below:
-                in_flight = True
-                flight_start = i
-            elif in_flight and not is_below:
-                in_flight = False
-                flight_duration = i - flight_start
-                if flight_duration >= config.MIN_FLIGHT_SAMPLES:
-                    flight_regions.append((flight_start, i))
-                    
-        # If flight still in progress at the end
-        if in_flight and len(below_threshold) - flight_start >= config.MIN_FLIGHT_SAMPLES:
-            flight_regions.append((flight_start, len(below_threshold)))
+        
+        # Run boundaries of below-threshold samples: padding with False on both sides
+        # makes every run start at a +1 edge and end at a -1 edge, including a flight
+        # still in progress at the end of the data
+        edges = np.diff(np.concatenate(([0], below_threshold.view(np.int8), [0])))
+        run_starts = np.flatnonzero(edges == 1)
+        run_ends = np.flatnonzero(edges == -1)
+        long_runs = (run_ends - run_starts) >= config.MIN_FLIGHT_SAMPLES
+        flight_regions = list(zip(run_starts[long_runs], run_ends[long_runs]))
             
         if flight_regions:
             # Find the longest flight phase
@@ -279,93 +367,85 @@ class JumpAnalyzer(QObject):
             
         return np.array([]), np.array([])
         
-    def _interpolate_takeoff(self, fz_data, takeoff_idx, flight_threshold):
-        """Interpolates the precise takeoff index using unfiltered data."""
-        if takeoff_idx > 0 and takeoff_idx < len(fz_data):
-            force_before = fz_data[takeoff_idx-1]
-            force_after = fz_data[takeoff_idx]
-            
+    @staticmethod
+    def _interpolate_crossing(fz_data, crossing_idx, threshold):
+        """
+        Fractional index where the unfiltered force crosses threshold between samples
+        crossing_idx - 1 and crossing_idx (same formula for downward and upward crossings).
+        """
+        if 0 < crossing_idx < len(fz_data):
+            force_before = float(fz_data[crossing_idx - 1])
+            force_after = float(fz_data[crossing_idx])
+            # Samples on opposite sides of the threshold are never equal; the guard only
+            # covers an index that does not actually bracket the threshold
             if force_before != force_after:
-                interp_fraction = (force_before - flight_threshold) / (force_before - force_after)
-                self._takeoff_idx_precise = (takeoff_idx - 1) + interp_fraction
-            else:
-                self._takeoff_idx_precise = float(takeoff_idx)
-        else:
-            self._takeoff_idx_precise = float(takeoff_idx)
-            
-    def _interpolate_landing(self, fz_data, landing_idx, flight_threshold, found_5N_crossing):
-        """Interpolates the precise landing index using unfiltered data."""
-        if found_5N_crossing and landing_idx > 0 and landing_idx < len(fz_data):
-            force_before = fz_data[landing_idx-1]
-            force_after = fz_data[landing_idx]
-            
-            if force_after != force_before:
-                interp_fraction = (flight_threshold - force_before) / (force_after - force_before)
-                self._landing_idx_precise = (landing_idx - 1) + interp_fraction
-            else:
-                self._landing_idx_precise = float(landing_idx)
-        else:
-            self._landing_idx_precise = float(landing_idx)
-            
-    def _calculate_flight_time(self, time_data_absolute, takeoff_idx, landing_idx):
-        """Calculate precise flight time using interpolated indices and wall-clock timing."""
-        if hasattr(self, '_takeoff_idx_precise') and self._takeoff_idx_precise >= 0:
-            takeoff_time = self._interpolated_index_to_wallclock_time(
-                self._takeoff_idx_precise, time_data_absolute
-            )
-        else:
+                return (crossing_idx - 1) + (force_before - threshold) / (force_before - force_after)
+        return float(crossing_idx)
+        
+    def _event_wallclock_times(self, time_data_absolute, takeoff_idx, landing_idx):
+        """
+        Wall-clock takeoff and landing times for a segment, from the interpolated indices
+        when available (converted together in one call), else the sample timestamps.
+        """
+        # Negative sentinels come back as NaN, like indices outside the data
+        takeoff_time, landing_time = self._interpolated_indices_to_wallclock(
+            (self._takeoff_idx_precise, self._landing_idx_precise), time_data_absolute
+        )
+        
+        if np.isnan(takeoff_time):
             takeoff_time = time_data_absolute[takeoff_idx]
-            
-        if hasattr(self, '_landing_idx_precise') and self._landing_idx_precise >= 0:
-            landing_time = self._interpolated_index_to_wallclock_time(
-                self._landing_idx_precise, time_data_absolute
-            )
-        else:
+        if np.isnan(landing_time):
             landing_time = time_data_absolute[landing_idx]
-            
-        return landing_time - takeoff_time
+        return float(takeoff_time), float(landing_time)
         
-    def _interpolated_index_to_wallclock_time(self, interpolated_index, time_data):
-        """Convert an interpolated index to wall-clock time using actual timestamps."""
-        if time_data is None or len(time_data) == 0:
-            return None
-            
-        if interpolated_index < 0 or interpolated_index >= len(time_data):
-            return None
-            
-        index_floor = int(interpolated_index)
-        index_frac = interpolated_index - index_floor
-        
-        if index_floor >= len(time_data) - 1:
-            return time_data[-1]
-        if index_floor < 0:
-            return time_data[0]
-            
+    def _interpolated_indices_to_wallclock(self, interpolated_indices, time_data):
+        """
+        Convert interpolated indices to wall-clock times using actual timestamps.
+        Indices that are NaN or outside the data map to NaN.
+        """
+        indices = np.asarray(interpolated_indices, dtype=np.float64)
+        times = np.full(indices.shape, np.nan)
+        n = 0 if time_data is None else len(time_data)
+        if n < 2:
+            return times
+            
+        valid = (indices >= 0) & (indices < n)
+        index_floor = np.minimum(np.floor(indices[valid]).astype(np.int64), n - 2)
+        # Clipping the fraction to 1 maps the last sample (floor == n - 1) onto time_data[-1]
+        index_frac = np.minimum(indices[valid] - index_floor, 1.0)
         time_before = time_data[index_floor]
-        time_after = time_data[index_floor + 1]
-        interpolated_time = time_before + index_frac * (time_after - time_before)
-        
-        return interpolated_time
+        times[valid] = time_before + index_frac * (time_data[index_floor + 1] - time_before)
+        return times
         
-    def _find_time_window_samples(self, time_array, duration_seconds):
-        """Find the number of samples that corresponds to a given time duration."""
-        if len(time_array) < 2:
-            return int(duration_seconds * self.sample_rate)
-            
-        total_time_span = time_array[-1] - time_array[0]
-        total_samples = len(time_array)
-        
-        effective_rate = total_samples / total_time_span if total_time_span > 0 else self.sample_rate
-        
-        return int(duration_seconds * effective_rate)
+    def _get_calibration_constants(self, body_weight_n, calibration_std):
+        """
+        Flight threshold, onset threshold (relative to bodyweight) and body mass for the
+        current calibration. Recomputed only when bodyweight or its std changes.
+        """
+        key = (body_weight_n, calibration_std)
+        if key != self._calibration_key:
+            # Use 5 SD threshold
+            SD_MULTIPLIER = 5
+            if calibration_std is None:
+                calibration_std = 5.0  # Fallback
+                
+            flight_threshold = max(config.BODYWEIGHT_THRESHOLD_N, body_weight_n * 0.2)
+            movement_threshold = -SD_MULTIPLIER * calibration_std
+            mass = body_weight_n / config.GRAVITY
+            self._calibration_constants = (flight_threshold, movement_threshold, mass)
+            self._calibration_key = key
+        return self._calibration_constants
         
-    def _find_movement_start(self, fz_filtered, first_takeoff_idx, body_weight_n, 
-                           calibration_std, calibration_complete_time, time_data_absolute):
-        """Find the start of countermovement for impulse calculation."""
+    def _find_movement_start(self, net_fz, first_takeoff_idx,
+                           movement_threshold, calibration_complete_time, time_data_absolute):
+        """
+        Find the start of countermovement for impulse calculation.
+        net_fz is the filtered force minus bodyweight, so bodyweight is the zero line.
+        """
         if first_takeoff_idx is None or first_takeoff_idx < 10:
             return 0
             
-        search_range_onset = fz_filtered[:first_takeoff_idx]
+        search_range_onset = net_fz[:first_takeoff_idx]
         
         if len(search_range_onset) < 10:
             return 0
@@ -379,63 +459,57 @@ class JumpAnalyzer(QObject):
             rel_calib_time = calibration_complete_time - segment_start_time
             
             if rel_calib_time > 0:
-                calib_idx = np.abs(time_data_absolute - (segment_start_time + rel_calib_time)).argmin()
-                buffer_samples = self._find_time_window_samples(time_data_absolute, 0.1)
-                search_start_idx = min(calib_idx + buffer_samples, len(search_range_onset) - 1)
+                calib_idx = nearest_index(time_data_absolute, segment_start_time + rel_calib_time)
+                search_start_idx = min(calib_idx + self._onset_buffer_samples, len(search_range_onset) - 1)
             else:
                 search_start_idx = 0
                 
-        # Use 5 SD threshold
-        SD_MULTIPLIER = 5
-        if calibration_std is None:
-            calibration_std = 5.0  # Fallback
-            
-        movement_threshold = body_weight_n - (SD_MULTIPLIER * calibration_std)
-        
         # Find first point where force drops below threshold
         movement_start_idx = search_start_idx
-        movement_found = False
-        
-        for i in range(search_start_idx, len(search_range_onset)):
-            if search_range_onset[i] < movement_threshold:
-                movement_start_idx = i
-                movement_found = True
-                break
-                
-        if movement_found:
-            # Search backward to find BW crossing
-            for i in range(movement_start_idx, search_start_idx, -1):
-                if i > 0:
-                    if ((search_range_onset[i] <= body_weight_n and search_range_onset[i-1] > body_weight_n) or 
-                        (search_range_onset[i] >= body_weight_n and search_range_onset[i-1] < body_weight_n)):
-                        movement_start_idx = i
-                        break
+        first_below = self._first_below(search_range_onset[search_start_idx:], movement_threshold)
+        
+        if first_below is not None:
+            movement_start_idx = search_start_idx + first_below
+            
+            # Search backward to find BW crossing: the last crossing (in either direction)
+            # between consecutive samples up to the threshold point
+            seg = search_range_onset[search_start_idx:movement_start_idx + 1]
+            prev, cur = seg[:-1], seg[1:]
+            bw_crossings = np.flatnonzero(((cur <= 0.0) & (prev > 0.0)) |
+                                          ((cur >= 0.0) & (prev < 0.0)))
+            if bw_crossings.size:
+                movement_start_idx = search_start_idx + int(bw_crossings[-1]) + 1
                         
         return movement_start_idx
         
-    def _calculate_impulse_height(self, time_data_absolute, fz_filtered, first_takeoff_idx,
-                                body_weight_n, calibration_std, calibration_complete_time, jump_number):
-        """Calculate jump height using impulse method."""
+    def _first_below(self, values, threshold):
+        """
+        Index of the first value below threshold, or None. Scans in blocks and stops at
+        the first block containing a hit, so data after the onset is never compared.
+        """
+        block = self._onset_block_samples
+        for block_start in range(0, len(values), block):
+            below = values[block_start:block_start + block] < threshold
+            j = int(below.argmax())
+            if below[j]:
+                return block_start + j
+        return None
+        
+    def _calculate_impulse_height(self, time_data_absolute, net_fz, movement_start_idx, first_takeoff_idx,
+                                body_weight_n, mass, jump_number):
+        """Calculate jump height using impulse method (net_fz is force minus bodyweight)."""
         results = {}
         
-        movement_start_idx = self._find_movement_start(
-            fz_filtered, first_takeoff_idx, body_weight_n,
-            calibration_std, calibration_complete_time, time_data_absolute
-        )
-        
         if first_takeoff_idx is None or first_takeoff_idx < 10:
             return results
             
-        # Get movement force and time
-        full_movement_force = fz_filtered[movement_start_idx:first_takeoff_idx]
+        # Get movement net force and time
+        net_force_full = net_fz[movement_start_idx:first_takeoff_idx]
         full_movement_time = time_data_absolute[movement_start_idx:first_takeoff_idx]
         
         if len(full_movement_time) > 10 and body_weight_n > 0:
-            mass = body_weight_n / config.GRAVITY
-            net_force_full = full_movement_force - body_weight_n
-            
             # Calculate total net impulse
-            net_impulse = np.trapz(net_force_full, full_movement_time)
+            net_impulse = _trapz_fast(net_force_full, full_movement_time)
             
             # Calculate takeoff velocity
             takeoff_velocity = net_impulse / mass
@@ -444,14 +518,15 @@ class JumpAnalyzer(QObject):
             jump_height_impulse_m = (takeoff_velocity**2) / (2 * config.GRAVITY)
             
             # Add appropriate keys based on the jump number
-            results[f'Jump #{jump_number} Jump Height (Impulse) (m)'] = round(jump_height_impulse_m, 3)
-            results[f'Jump #{jump_number} Net Impulse (Ns)'] = round(net_impulse, 2)
+            results[result_key(jump_number, RESULT_HEIGHT_IMPULSE)] = round(jump_height_impulse_m, 3)
+            results[result_key(jump_number, RESULT_NET_IMPULSE)] = round(net_impulse, 2)
             
         return results
         
     def _emit_event_markers(self, time_data_absolute, fz_filtered, jump_number,
-                          movement_start_idx_abs, first_takeoff_idx, first_landing_idx):
-        """Emit event markers for visualization."""
+                          movement_start_idx_abs, first_takeoff_idx, first_landing_idx,
+                          takeoff_time, landing_time):
+        """Emit event markers for visualization (event times from _event_wallclock_times)."""
         if (time_data_absolute is None or len(time_data_absolute) == 0 or 
             movement_start_idx_abs >= len(time_data_absolute) or 
             first_takeoff_idx is None or first_takeoff_idx >= len(time_data_absolute) or
@@ -460,26 +535,18 @@ class JumpAnalyzer(QObject):
             
         # Get exact event times
         jump_start_time = time_data_absolute[movement_start_idx_abs]
-        jump_start_force = fz_filtered[movement_start_idx_abs]
+        jump_start_force = float(fz_filtered[movement_start_idx_abs])
         
-        # Use precise interpolated values if available
-        if hasattr(self, '_takeoff_idx_precise') and self._takeoff_idx_precise >= 0:
-            takeoff_time = self._interpolated_index_to_wallclock_time(
-                self._takeoff_idx_precise, time_data_absolute
-            )
+        # Interpolated events sit exactly on the threshold
+        if self._takeoff_idx_precise >= 0:
             takeoff_force = config.BODYWEIGHT_THRESHOLD_N
         else:
-            takeoff_time = time_data_absolute[first_takeoff_idx]
-            takeoff_force = fz_filtered[first_takeoff_idx]
+            takeoff_force = float(fz_filtered[first_takeoff_idx])
             
-        if hasattr(self, '_landing_idx_precise') and self._landing_idx_precise > 0:
-            landing_time = self._interpolated_index_to_wallclock_time(
-                self._landing_idx_precise, time_data_absolute
-            )
+        if self._landing_idx_precise >= 0:
             landing_force = config.BODYWEIGHT_THRESHOLD_N
         else:
-            landing_time = time_data_absolute[first_landing_idx]
-            landing_force = fz_filtered[first_landing_idx]
+            landing_force = float(fz_filtered[first_landing_idx])
             
         # Create event markers dictionary
         event_markers = {
@@ -5,6 +5,7 @@ Detects takeoff and landing events based on force thresholds.
 import numpy as np
 from PyQt6.QtCore import QObject, pyqtSignal, QTimer
 import config
+from .status_throttle import StatusThrottle
 
 
 class JumpDetector(QObject):
@@ -33,10 +34,20 @@ class JumpDetector(QObject):
         self._last_contact_index = 0  # Index in full buffer where last contact phase began
         self._last_takeoff_index = None  # Index in full buffer of the last takeoff
         self._jump_counter = 0
+        self._status_throttle = StatusThrottle()
         
         # Thresholds
         self._flight_threshold = config.BODYWEIGHT_THRESHOLD_N
         
+        # Minimum run lengths: the greater of the configured counts and the time-based
+        # requirements. Timestamps are generated from sample counts, so the effective
+        # rate is the nominal rate and these only need computing once.
+        self._min_flight_samples = max(config.MIN_FLIGHT_SAMPLES, int(config.MIN_FLIGHT_TIME * sample_rate))
+        self._min_contact_samples = max(config.MIN_CONTACT_SAMPLES, int(0.02 * sample_rate))  # 20ms of contact
+        
+        # Look-back needed to check for MIN_FLIGHT/CONTACT samples
+        self.history_samples = max(self._min_flight_samples, self._min_contact_samples) * 3
+        
     def reset(self):
         """Reset jump detection state."""
         self._in_flight = False
@@ -44,50 +55,26 @@ class JumpDetector(QObject):
         self._last_takeoff_index = None
         self._jump_counter = 0
         
-    def process_chunk(self, time_buffer, force_buffer, num_samples_in_chunk):
+    def process_chunk(self, recent_fz, total_samples):
         """
         Process new data chunk for jump detection.
         
         Args:
-            time_buffer: List of time arrays (from buffer manager)
-            force_buffer: List of force arrays (from buffer manager)
-            num_samples_in_chunk: Number of samples in the current chunk
+            recent_fz: 1D array of the most recent history_samples summed forces
+                       (from buffer manager), or None if not yet available
+            total_samples: Samples processed since reset, including the current chunk
             
         Returns:
             tuple: (jump_detected, jump_info) where jump_info is dict with jump details
         """
-        # Calculate minimum samples needed based on configuration
-        min_flight_samples = config.MIN_FLIGHT_SAMPLES
-        min_contact_samples = config.MIN_CONTACT_SAMPLES
-        
-        # If we have recent timing data, calculate actual sample requirements
-        if len(time_buffer) > 0:
-            recent_time_chunk = time_buffer[-1]
-            if len(recent_time_chunk) > 1:
-                # Calculate effective sample rate from recent data
-                recent_dt = np.mean(np.diff(recent_time_chunk))
-                effective_rate = 1.0 / recent_dt if recent_dt > 0 else self.sample_rate
-                
-                # Calculate time-based sample requirements
-                time_based_flight_samples = int(config.MIN_FLIGHT_TIME * effective_rate)
-                time_based_contact_samples = int(0.02 * effective_rate)  # 20ms of contact
-                
-                # Use the greater of configured or time-based counts
-                min_flight_samples = max(config.MIN_FLIGHT_SAMPLES, time_based_flight_samples)
-                min_contact_samples = max(config.MIN_CONTACT_SAMPLES, time_based_contact_samples)
-        
-        # Need enough data to check for MIN_FLIGHT/CONTACT samples
-        history_needed = max(min_flight_samples, min_contact_samples) * 3  # Increase look-back
+        min_flight_samples = self._min_flight_samples
+        min_contact_samples = self._min_contact_samples
         
         # Check if we have enough data
-        total_samples = sum(chunk.shape[0] for chunk in force_buffer)
-        if total_samples + num_samples_in_chunk <= history_needed:
+        if recent_fz is None or len(recent_fz) < self.history_samples:
             return False, None
             
-        # Reconstruct summed Fz history for detection
-        full_fz_temp = np.concatenate([np.sum(chunk, axis=1) for chunk in force_buffer])
-        recent_fz = full_fz_temp[-history_needed:]  # Look at the last part
-        current_index = len(full_fz_temp) - 1
+        current_index = total_samples - 1
         
         # Get the state of the *last* sample in the current chunk
         is_below_threshold = len(recent_fz) > 0 and recent_fz[-1] < self._flight_threshold
@@ -96,11 +83,13 @@ class JumpDetector(QObject):
         if len(recent_fz) > 0:
             # Force drops below threshold - potential takeoff
             if not self._in_flight and is_below_threshold:
-                self.status_signal.emit(f"Potential takeoff detected - Force: {recent_fz[-1]:.2f}N, Threshold: {self._flight_threshold:.2f}N")
+                self._emit_throttled_status("Potential takeoff detected - Force: {:.2f}N, Threshold: {:.2f}N",
+                                            recent_fz[-1], self._flight_threshold)
             
             # Force rises above threshold - potential landing
             if self._in_flight and not is_below_threshold:
-                self.status_signal.emit(f"Potential landing detected - Force: {recent_fz[-1]:.2f}N, Threshold: {self._flight_threshold:.2f}N")
+                self._emit_throttled_status("Potential landing detected - Force: {:.2f}N, Threshold: {:.2f}N",
+                                            recent_fz[-1], self._flight_threshold)
         
         jump_info = None
         
@@ -109,16 +98,17 @@ class JumpDetector(QObject):
             if is_below_threshold and len(recent_fz) >= min_flight_samples:
                 # Get the most recent samples
                 recent_samples = recent_fz[-min_flight_samples:]
-                # Check if ALL samples in the window are below threshold
-                if np.all(recent_samples < self._flight_threshold):
+                # Check if ALL samples in the window are below threshold (a single
+                # max reduction, no temporary boolean mask)
+                if recent_samples.max() < self._flight_threshold:
                     self._in_flight = True
-                    # Find the first sample below threshold
-                    below_indices = np.where(recent_fz < self._flight_threshold)[0]
-                    # Find the first consecutive sequence of MIN_FLIGHT_SAMPLES
-                    for i in range(len(below_indices) - min_flight_samples + 1):
-                        if np.all(np.diff(below_indices[i:i+min_flight_samples]) == 1):
-                            self._last_takeoff_index = current_index - (len(recent_fz) - below_indices[i])
-                            break
+                    # Find the first run of min_flight_samples consecutive samples below
+                    # threshold: a window sum over the mask equals the window length there
+                    below_mask = (recent_fz < self._flight_threshold).astype(np.int32)
+                    run_lengths = np.convolve(below_mask, np.ones(min_flight_samples, dtype=np.int32), mode='valid')
+                    run_starts = np.flatnonzero(run_lengths == min_flight_samples)
+                    if run_starts.size:
+                        self._last_takeoff_index = current_index - (len(recent_fz) - run_starts[0])
                     else:
                         # Fallback if no consecutive sequence found
                         self._last_takeoff_index = current_index - min_flight_samples + 1
@@ -131,7 +121,7 @@ class JumpDetector(QObject):
                 # Get most recent samples
                 recent_samples = recent_fz[-min_contact_samples:]
                 # Check if ALL recent samples are above threshold
-                if np.all(recent_samples >= self._flight_threshold):
+                if recent_samples.min() >= self._flight_threshold:
                     # Landing confirmed!
                     landing_index = current_index - min_contact_samples + 1
                     self._in_flight = False
@@ -161,6 +151,17 @@ class JumpDetector(QObject):
                         
         return False, jump_info
         
+    def _emit_throttled_status(self, template, *args):
+        """
+        Emits an informational status message from the per-chunk path, dropping it if
+        another was sent within config.STATUS_MIN_INTERVAL_S or nobody is listening. The
+        message is only formatted when it is actually sent.
+        """
+        if self.receivers(self.status_signal) == 0:
+            return
+        if self._status_throttle.ready():
+            self.status_signal.emit(template.format(*args))
+        
     def get_jump_count(self):
         """Get the current jump counter value."""
         return self._jump_counter
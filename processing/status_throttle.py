@@ -0,0 +1,25 @@
+"""
+Rate limiting for informational status messages sent from per-chunk code paths.
+
+Producers (the DAQ worker loop, the jump detector) use this to avoid queueing a
+signal and formatting a message for every chunk. MainWindow separately coalesces
+whatever reaches the status bar; that bounds repaints, not signal traffic.
+"""
+import time
+import config
+
+
+class StatusThrottle:
+    """Allows at most one message per config.STATUS_MIN_INTERVAL_S."""
+
+    def __init__(self, min_interval_s=config.STATUS_MIN_INTERVAL_S):
+        self._min_interval_s = min_interval_s
+        self._last_time = 0.0  # monotonic time of the last message let through
+
+    def ready(self):
+        """Returns True, and starts a new interval, if a message may be sent now."""
+        now = time.monotonic()
+        if now - self._last_time < self._min_interval_s:
+            return False
+        self._last_time = now
+        return True
@@ -1,6 +1,7 @@
 """
 Manages the PyQtGraph plot for displaying live Force vs. Time data.
 """
+import logging
 import numpy as np
 import pyqtgraph as pg
 from PyQt6.QtCore import pyqtSlot, QObject, QTimer
@@ -8,6 +9,8 @@ from collections import deque
 
 import config
 
+logger = logging.getLogger(__name__)
+
 pg.setConfigOptions(useOpenGL=True, antialias=True)
 
 class PlotHandler(QObject):
@@ -23,6 +26,7 @@ class PlotHandler(QObject):
         self.plot_item = None
         self.plot_curves = [] # List to hold all plot curves (individual + sum)
         self.num_channels = 0 # Will be set in setup_plot
+        self._channel_ones = None # Weights for summing channels, set in setup_plot
         self.current_view_mode = 'summed' # 'summed' or 'individual'
 
         # Define colors for the plot lines (add more if > 4 channels needed)
@@ -131,6 +135,7 @@ class PlotHandler(QObject):
     def setup_plot(self, num_channels):
         """Initializes the plot appearance and data structures for multi-channel data."""
         self.num_channels = num_channels
+        self._channel_ones = np.ones(num_channels)
         if self.plot_item:
              self.plot_item.clear() # Clear previous items if re-setting up
         else:
@@ -325,7 +330,7 @@ class PlotHandler(QObject):
         self.plot_buffer_time.extend(time_chunk)
         for i in range(self.num_channels):
             self.plot_buffer_forces[i].extend(forces_by_channel[i])
-        summed = np.sum(forces_by_channel, axis=0)
+        summed = self._sum_channels(force_chunk_multi)
         self.plot_buffer_forces[self.num_channels].extend(summed)
         # Update only visible curve(s)
         if self.plot_buffer_time:
@@ -381,8 +386,8 @@ class PlotHandler(QObject):
             # Calculate from full data if no acquisition max is stored
             if self.current_view_mode == 'summed':
                 # Sum all channels
-                summed_forces = np.sum(self._full_data_forces, axis=1)
-                reset_y_max = max(summed_forces) * 1.1 if len(summed_forces) > 0 else config.PLOT_Y_AXIS_INITIAL_MAX
+                summed_forces = self._sum_channels(self._full_data_forces)
+                reset_y_max = summed_forces.max() * 1.1 if len(summed_forces) > 0 else config.PLOT_Y_AXIS_INITIAL_MAX
             else:
                 # Individual channels
                 reset_y_max = np.max(self._full_data_forces) * 1.1 if self._full_data_forces.size > 0 else config.PLOT_Y_AXIS_INITIAL_MAX
@@ -432,6 +437,11 @@ class PlotHandler(QObject):
         else:
             print("PlotHandler: Warning - received None data in set_full_data")
     
+    def _sum_channels(self, forces):
+        """Sums a [samples, channels] array across channels as one matrix-vector product."""
+        # Match the data dtype so float32 buffer copies are not promoted to float64
+        return forces @ self._channel_ones.astype(forces.dtype, copy=False)
+    
     def _update_plot_with_full_data(self):
         """Updates the plot curves using the full data."""
         if not self._using_full_data or self._full_data_time is None or self._full_data_forces is None:
@@ -440,7 +450,7 @@ class PlotHandler(QObject):
         # Update curves based on current view mode
         if self.current_view_mode == 'summed':
             # Show summed channel
-            summed_forces = np.sum(self._full_data_forces, axis=1)
+            summed_forces = self._sum_channels(self._full_data_forces)
             self.plot_curves[self.num_channels].setData(self._full_data_time, summed_forces)
             
             # Hide individual channels
@@ -485,7 +495,7 @@ class PlotHandler(QObject):
         self._remove_event_markers()
         
         if not events_dict:
-            print("No event data provided to add_event_markers")
+            logger.debug("No event data provided to add_event_markers")
             return
             
         jump_num = events_dict.get('jump_number', 0)
@@ -529,9 +539,11 @@ class PlotHandler(QObject):
                     self._event_markers[event_type] = []
                 self._event_markers[event_type].extend([scatter_item, text_item])
                 
-                print(f"Added marker for Jump #{jump_num} {event_type} at t={time_val:.3f}s, F={force_val:.1f}N")
+                logger.debug("Added marker for Jump #%s %s at t=%.3fs, F=%.1fN",
+                             jump_num, event_type, time_val, force_val)
             else:
-                print(f"Missing data for {event_type} marker: {time_key} or {force_key} not in events_dict")
+                logger.debug("Missing data for %s marker: %s or %s not in events_dict",
+                             event_type, time_key, force_key)
                 
         # Adjust view range to show all markers if needed
         self._ensure_event_markers_visible(events_dict)
@@ -564,4 +576,4 @@ class PlotHandler(QObject):
             
             if min_time < current_min or max_time > current_max:
                 self.plot_item.setXRange(min_time, max_time, padding=0.05)
-                print(f"Adjusted view to show all jump markers: t=[{min_time:.2f}, {max_time:.2f}]") 
\ No newline at end of file
+                logger.debug("Adjusted view to show all jump markers: t=[%.2f, %.2f]", min_time, max_time) 
\ No newline at end of file